@@ -9,35 +9,69 @@ Usage:
   ignis open-window ignomi-bookmarks  # Open bookmarks panel only
   ignis open-window ignomi-search     # Open search panel only
   ignis open-window ignomi-frequent   # Open frequent panel only
+
+Set IGNOMI_BACKDROP=0 in the Ignis environment to run without the
+blurred screenshot backdrop.
 """
 
+import logging
+import logging.handlers
 import os
 import sys
 from pathlib import Path
 
 from ignis.app import IgnisApp
-from loguru import logger
-
-# Configure logging: file + stderr
-logger.remove()  # Remove default stderr handler
-logger.add(sys.stderr, level="WARNING")
-logger.add(
-    Path.home() / ".local" / "share" / "ignomi" / "ignomi.log",
-    rotation="1 MB",
-    retention=3,
-    level="DEBUG",
-)
+
+# Configure logging: file + stderr. Every launcher module logs under the
+# "ignomi" hierarchy, so Ignis's own logging is left untouched.
+# IGNOMI_LOG_LEVEL=DEBUG enables debug output in the log file.
+logger = logging.getLogger("ignomi")
+if not logger.handlers:
+    _log_level = os.getenv("IGNOMI_LOG_LEVEL", "INFO").upper()
+    try:
+        logger.setLevel(_log_level)
+        _bad_log_level = None
+    except ValueError:
+        # A typo in a debug env var shouldn't stop the launcher starting
+        logger.setLevel(logging.INFO)
+        _bad_log_level = _log_level
+    logger.propagate = False
+
+    _formatter = logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s")
+
+    _stderr_handler = logging.StreamHandler(sys.stderr)
+    _stderr_handler.setLevel(logging.WARNING)
+    _stderr_handler.setFormatter(_formatter)
+    logger.addHandler(_stderr_handler)
+
+    _log_path = Path.home() / ".local" / "share" / "ignomi" / "ignomi.log"
+    _log_path.parent.mkdir(parents=True, exist_ok=True)
+    _file_handler = logging.handlers.RotatingFileHandler(
+        _log_path, maxBytes=1_048_576, backupCount=3,
+    )
+    _file_handler.setFormatter(_formatter)
+    logger.addHandler(_file_handler)
+
+    if _bad_log_level:
+        logger.warning("Unknown IGNOMI_LOG_LEVEL %r, using INFO", _bad_log_level)
 
 # Add launcher to path dynamically (works from any location/worktree)
-# Resolve symlink to get the actual launcher directory
+# Resolve symlink to get the actual launcher directory. This is the only
+# place the import root is set up — modules under launcher/ import each
+# other as top-level packages (panels, utils, services, search).
 config_dir = os.path.dirname(os.path.realpath(__file__))
-sys.path.insert(0, config_dir)
+if config_dir not in sys.path:
+    sys.path.insert(0, config_dir)
 
-from panels.backdrop import create_backdrop_window
 from panels.bookmarks import BookmarksPanel
 from panels.frequent import FrequentPanel
 from panels.search import SearchPanel
 
+# Panels in creation order, instantiated once each. The window's .panel
+# attribute is how cross-panel calls find each other
+# (e.g. search → bookmarks refresh via app.get_window("ignomi-bookmarks")).
+_PANEL_CLASSES = (BookmarksPanel, SearchPanel, FrequentPanel)
+
 # Get Ignis app instance
 app = IgnisApp.get_default()
 
@@ -48,29 +82,30 @@ styles_dir = os.path.join(config_dir, "styles")
 try:
     app.apply_css(os.path.join(styles_dir, "colors.css"), style_priority="user")
 except Exception as e:
-    logger.warning(f"Could not load colors.css: {e}")
+    logger.warning("Could not load colors.css: %s", e)
 
 try:
     app.apply_css(os.path.join(styles_dir, "main.css"), style_priority="user")
 except Exception as e:
-    logger.warning(f"Could not load main.css: {e}")
+    logger.warning("Could not load main.css: %s", e)
+
+# Create backdrop (full-screen blur overlay) — IGNOMI_BACKDROP=0 disables it
+# and skips importing the capture/blur module entirely
+if os.getenv("IGNOMI_BACKDROP", "1") == "1":
+    from panels.backdrop import create_backdrop_window
+
+    backdrop_window = create_backdrop_window()
 
-# Create backdrop (full-screen blur overlay)
-backdrop_window = create_backdrop_window()
 
-# Create panels
-bookmarks_panel = BookmarksPanel()
-search_panel = SearchPanel()
-frequent_panel = FrequentPanel()
+def _create_panel(panel_class):
+    """Instantiate a panel and build its window."""
+    panel = panel_class()
+    window = panel.create_window()
+    # Store panel reference on window for cross-panel communication
+    window.panel = panel
+    return window
 
-# Create windows
-bookmarks_window = bookmarks_panel.create_window()
-search_window = search_panel.create_window()
-frequent_window = frequent_panel.create_window()
 
-# Store panel references on windows for cross-panel communication
-bookmarks_window.panel = bookmarks_panel
-search_window.panel = search_panel
-frequent_window.panel = frequent_panel
+panel_windows = [_create_panel(panel_class) for panel_class in _PANEL_CLASSES]
 
 logger.info("Ignomi launcher initialized successfully")
@@ -12,23 +12,26 @@ so the sharp screenshot appears immediately and blur builds progressively.
 
 Per-monitor settings allow different blur radius and brightness for
 HDR vs SDR monitors.
+
+Blur is deliberately CPU-side rather than a Gsk blur node: a blur node
+is re-rendered on every redraw of a full-screen surface, falls back to
+software under GSK_RENDERER=cairo, and its frames can't be cached for
+the close animation. Pre-rendered frames cost one burst of work per
+open and nothing per redraw.
 """
 
 import io
+import logging
 import os
-import subprocess
-import sys
+import re
 import threading
-from concurrent.futures import ThreadPoolExecutor
 
-from gi.repository import Gdk, GdkPixbuf, GLib
-from ignis import widgets
-from loguru import logger
-from PIL import Image, ImageEnhance, ImageFilter
+from gi.repository import Gdk, GLib, Gtk
+from utils.helpers import get_monitor_under_cursor
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from ignis import widgets
 
-from utils.helpers import get_monitor_under_cursor
+logger = logging.getLogger(f"ignomi.{__name__}")
 
 # Default blur settings
 _BLUR_DEFAULTS = {
@@ -44,49 +47,120 @@ _MONITOR_SETTINGS = {
     },
 }
 
+
+def _resolve_blur_settings(overrides: dict) -> tuple[int, float]:
+    """Merge one monitor's overrides with the defaults → (radius, brightness)."""
+    return (
+        overrides.get("radius", _BLUR_DEFAULTS["radius"]),
+        overrides.get("brightness", _BLUR_DEFAULTS["brightness"]),
+    )
+
+
+# Resolved once at load so an open is a single dict lookup
+_DEFAULT_BLUR = _resolve_blur_settings(_BLUR_DEFAULTS)
+_RESOLVED_MONITOR_SETTINGS = {
+    connector: _resolve_blur_settings(overrides)
+    for connector, overrides in _MONITOR_SETTINGS.items()
+}
+
 # Animation timing — tuned to match Hyprland panel slide animations
 _BLUR_STEPS = 7            # Number of blur frames (including sharp)
 _OPEN_DURATION_MS = 150    # Total open blur animation time
 _CLOSE_DURATION_MS = 150   # Total close blur animation time
 
+# Blur runs on a downscaled copy of the screenshot; the Picture's
+# content_fit="cover" scales it back up. At radius ≥ 10 the lost detail
+# is invisible, and every blur pass touches 1/4 of the pixels.
+_CAPTURE_SCALE = 2
+
 
-def _ease_in_intervals(total_ms: int, steps: int) -> list[int]:
-    """Compute per-frame intervals with ease-in timing (slow start, fast finish).
+def _animations_enabled() -> bool:
+    """False when the user asked for reduced motion.
 
-    Uses quadratic ease-in: t^2. Early frames get longer intervals,
-    later frames get shorter — blur accelerates as it progresses.
+    Honours IGNOMI_REDUCED_MOTION=1 and GTK's gtk-enable-animations,
+    which follows the desktop's enable-animations preference.
     """
-    if steps <= 1:
-        return [total_ms]
+    if os.getenv("IGNOMI_REDUCED_MOTION", "0") == "1":
+        return False
+    settings = Gtk.Settings.get_default()
+    return settings.get_property("gtk-enable-animations") if settings else True
+
+
+def _ease_in(t: float) -> float:
+    """Quadratic ease-in: slow start, fast finish — blur accelerates."""
+    return t * t
+
+
+def _ease_out(t: float) -> float:
+    """Quadratic ease-out, the mirror of _ease_in — fast start, slow finish."""
+    return 1.0 - (1.0 - t) * (1.0 - t)
+
 
-    # Quadratic ease-in: normalized positions 0..1, squared
-    raw = [i / (steps - 1) for i in range(steps)]
-    # Intervals are the differences between consecutive positions
-    deltas = [raw[i + 1] - raw[i] for i in range(steps - 1)]
-    total_delta = sum(deltas)
-    # Scale to actual milliseconds, ensure minimum 10ms per frame
-    intervals = [max(10, int(d / total_delta * total_ms)) for d in deltas]
-    return intervals
+# Monitor index → connector name, rebuilt when monitors are hotplugged so
+# lookups on open never touch the GListModel
+_connector_cache: dict[int, str] | None = None
+
+
+def _rebuild_connector_cache(monitors, *_args) -> None:
+    """Refresh the connector cache from the display's monitor list."""
+    global _connector_cache
+    _connector_cache = {
+        idx: monitors.get_item(idx).get_connector()
+        for idx in range(monitors.get_n_items())
+    }
 
 
 def _get_connector_for_monitor(monitor_idx: int) -> str:
     """Get the Wayland connector name for a GTK monitor index."""
-    display = Gdk.Display.get_default()
-    if display:
+    if _connector_cache is None:
+        display = Gdk.Display.get_default()
+        if not display:
+            return ""
         monitors = display.get_monitors()
-        if monitor_idx < monitors.get_n_items():
-            return monitors.get_item(monitor_idx).get_connector()
-    return ""
+        monitors.connect("items-changed", _rebuild_connector_cache)
+        _rebuild_connector_cache(monitors)
+    return _connector_cache.get(monitor_idx, "")
+
+
+# Binary PPM header as written by grim: "P6\n<w> <h>\n255\n"
+_PPM_HEADER = re.compile(rb"P6\s+(\d+)\s+(\d+)\s+255\s")
+
+
+def _decode_ppm(data: bytes):
+    """Wrap grim's PPM output as an RGB Image without decoding it.
+
+    A P6 file with maxval 255 is a short header followed by raw RGB rows,
+    so the payload can be viewed in place instead of copied through PIL's
+    PPM decoder. Anything unexpected falls back to Image.open().
+    """
+    from PIL import Image
+
+    match = _PPM_HEADER.match(data)
+    if match:
+        width, height = int(match.group(1)), int(match.group(2))
+        pixels = memoryview(data)[match.end():]
+        if len(pixels) >= width * height * 3:
+            return Image.frombuffer(
+                "RGB", (width, height), pixels, "raw", "RGB", 0, 1,
+            )
+    return Image.open(io.BytesIO(data))
 
 
-def _capture_and_prepare(connector: str):
+def _capture_and_prepare(connector: str, animate: bool):
     """Capture screenshot and prepare base image.
 
-    Returns (img, max_radius) or (None, None) on failure.
+    Returns (img, max_radius) or (None, None) on failure. The image is
+    only downscaled when it will be blurred; a sharp-only backdrop keeps
+    the full-resolution capture.
+
+    Runs on the worker thread, so PIL and subprocess are imported here
+    rather than at module load — keeps them off the Ignis startup path.
     """
-    settings = _MONITOR_SETTINGS.get(connector, _BLUR_DEFAULTS)
-    max_radius = settings.get("radius", _BLUR_DEFAULTS["radius"])
-    brightness = settings.get("brightness", _BLUR_DEFAULTS["brightness"])
+    import subprocess
+
+    from PIL import ImageEnhance
+
+    max_radius, brightness = _RESOLVED_MONITOR_SETTINGS.get(connector, _DEFAULT_BLUR)
 
     try:
         result = subprocess.run(
@@ -95,10 +169,16 @@ def _capture_and_prepare(connector: str):
             timeout=2,
         )
         if result.returncode != 0:
-            logger.warning(f"grim failed for {connector}: {result.stderr.decode()}")
+            logger.warning("grim failed for %s: %s", connector, result.stderr.decode())
             return None, None
 
-        img = Image.open(io.BytesIO(result.stdout))
+        img = _decode_ppm(result.stdout)
+
+        # Downscale first so brightness and blur both run on fewer pixels;
+        # radius shrinks with the image to keep the same visual blur
+        if animate and max_radius >= _CAPTURE_SCALE > 1:
+            img = img.reduce(_CAPTURE_SCALE)
+            max_radius //= _CAPTURE_SCALE
 
         if brightness != 1.0:
             img = ImageEnhance.Brightness(img).enhance(brightness)
@@ -106,25 +186,48 @@ def _capture_and_prepare(connector: str):
         return img, max_radius
 
     except subprocess.TimeoutExpired:
-        logger.warning(f"grim timed out for {connector}")
+        logger.warning("grim timed out for %s", connector)
         return None, None
     except Exception as e:
-        logger.warning(f"Backdrop capture failed for {connector}: {e}")
+        logger.warning("Backdrop capture failed for %s: %s", connector, e)
         return None, None
 
 
 def _rgb_to_texture(rgb_bytes: bytes, width: int, height: int) -> Gdk.Texture:
-    """Convert raw RGB bytes to a Gdk.Texture."""
-    pixbuf = GdkPixbuf.Pixbuf.new_from_data(
-        rgb_bytes,
-        GdkPixbuf.Colorspace.RGB,
-        False,
-        8,
+    """Wrap raw RGB bytes in a Gdk.MemoryTexture.
+
+    GSK samples the GLib.Bytes directly — no intermediate GdkPixbuf and
+    no second normalizing copy inside GDK.
+    """
+    return Gdk.MemoryTexture.new(
         width,
         height,
+        Gdk.MemoryFormat.R8G8B8,
+        GLib.Bytes.new(rgb_bytes),
         width * 3,
     )
-    return Gdk.Texture.new_for_pixbuf(pixbuf)
+
+
+_blur_pool = None
+
+
+def _get_blur_pool():
+    """Return the shared blur thread pool, creating it on first open.
+
+    Kept alive for the life of the daemon so worker threads stay warm
+    across launcher opens instead of being spawned and joined each time.
+    Called on the main thread so creation never races.
+    """
+    global _blur_pool
+    if _blur_pool is None:
+        import atexit
+        from concurrent.futures import ThreadPoolExecutor
+
+        _blur_pool = ThreadPoolExecutor(
+            max_workers=_BLUR_STEPS, thread_name_prefix="backdrop-blur",
+        )
+        atexit.register(_blur_pool.shutdown, wait=False)
+    return _blur_pool
 
 
 def create_backdrop_window():
@@ -152,9 +255,13 @@ def create_backdrop_window():
     )
 
     window._backdrop_picture = picture
-    window._blur_frames = None   # List of (rgb_bytes, w, h) from sharp → blurred
-    window._anim_gen = 0         # Generation counter to cancel stale animations
+    window._blur_frames = None   # List of Gdk.Texture from sharp → blurred
+    window._last_rgb = None      # Bytes behind the newest texture (dedupes repeated radii)
+    window._anim_gen = 0         # Generation counter to cancel stale frame streams
     window._closing = False      # True during close animation
+    window._anim = None          # Running animation state (see _start_animation)
+    window._tick_id = None       # Frame-clock tick callback driving _anim
+    window._animate = _animations_enabled()  # False → single sharp frame, no blur ramp
 
     # Export close animation for helpers.py to call
     window._start_close_animation = lambda on_done: _start_close_animation(window, on_done)
@@ -172,92 +279,178 @@ def _on_visibility_changed(window, param):
         gen = window._anim_gen
 
         connector = _get_connector_for_monitor(window.monitor)
-        logger.debug(f"Backdrop opening: monitor_idx={window.monitor}, connector='{connector}'")
+        logger.debug("Backdrop opening: monitor_idx=%s, connector='%s'", window.monitor, connector)
+
+        animate = window._animate
+        pool = _get_blur_pool() if animate else None
 
         def do_capture_and_stream():
-            img, max_radius = _capture_and_prepare(connector)
+            from PIL import Image, ImageFilter
+
+            img, max_radius = _capture_and_prepare(connector, animate)
             if img is None:
-                logger.warning(f"Backdrop capture failed: connector='{connector}'")
+                logger.warning("Backdrop capture failed: connector='%s'", connector)
                 return
 
             width, height = img.size
-            intervals = _ease_in_intervals(_OPEN_DURATION_MS, _BLUR_STEPS)
 
             # Pre-load image data — PIL Image is NOT thread-safe, so
             # img.tobytes() / img.filter() from multiple threads races.
-            # Load pixels once, then give each thread its own Image copy.
+            # Load pixels once, then give each thread its own Image view.
             img.load()
             base_bytes = img.tobytes()
 
-            def blur_frame(i):
-                radius = int(max_radius * i / (_BLUR_STEPS - 1))
+            # Nothing to animate — show the sharp capture and skip the
+            # blur pipeline entirely
+            if max_radius == 0 or not animate:
+                GLib.idle_add(_show_streamed_frame, window, (base_bytes, width, height), 0, gen, False)
+                return
+
+            # Frame radii ramp linearly from sharp to max_radius. Small radii
+            # collapse to the same integer, so blur each distinct radius once
+            # — PIL's GaussianBlur is an extended box blur whose cost does not
+            # depend on radius, so duplicates are pure waste.
+            radii = [int(max_radius * i / (_BLUR_STEPS - 1)) for i in range(_BLUR_STEPS)]
+
+            def blur_radius(radius):
                 if radius == 0:
-                    return i, (base_bytes, width, height)
-                # Each thread gets its own Image from the shared bytes
-                frame_img = Image.frombytes("RGB", (width, height), base_bytes)
+                    return radius, base_bytes
+                # Each thread gets its own read-only Image over the shared
+                # bytes — frombuffer wraps them without copying
+                frame_img = Image.frombuffer(
+                    "RGB", (width, height), base_bytes, "raw", "RGB", 0, 1,
+                )
                 blurred = frame_img.filter(ImageFilter.GaussianBlur(radius=radius))
-                return i, (blurred.tobytes(), width, height)
+                return radius, blurred.tobytes()
 
             # Generate all blur frames concurrently — ~60ms instead of ~400ms
-            with ThreadPoolExecutor(max_workers=_BLUR_STEPS) as pool:
-                results = list(pool.map(blur_frame, range(_BLUR_STEPS)))
+            blurred_by_radius = dict(pool.map(blur_radius, sorted(set(radii))))
+            results = [
+                (i, (blurred_by_radius[radius], width, height))
+                for i, radius in enumerate(radii)
+            ]
 
             # Stream frames to main thread in order
             for i, frame in results:
-                delay = intervals[i] if i < len(intervals) else 0
-                GLib.idle_add(_show_streamed_frame, window, frame, i, gen, delay)
+                GLib.idle_add(_show_streamed_frame, window, frame, i, gen, True)
 
         threading.Thread(target=do_capture_and_stream, daemon=True).start()
     else:
         # Window hidden (after close animation or external close)
         window._anim_gen += 1
+        _stop_animation(window)
         window._backdrop_picture.set_paintable(None)
         window._blur_frames = None
+        window._last_rgb = None
         window._closing = False
 
 
-def _show_streamed_frame(window, frame, idx, gen, delay_ms):
-    """Display a frame streamed from the background thread.
+def _show_streamed_frame(window, frame, idx, gen, animate):
+    """Collect a frame streamed from the background thread.
 
-    Frame 0 shows immediately. Subsequent frames are delayed by their
-    eased interval, but only relative to when they arrive from the
-    background thread — no artificial wait for all frames to generate.
+    The first (sharp) frame starts the open animation; later frames are
+    picked up by the tick callback as they arrive — no artificial wait
+    for all frames to generate. Without animation the frame is shown
+    directly.
     """
     if window._anim_gen != gen or not window.get_visible():
         return False
 
-    # Store frame for close animation
+    # Upload once and keep the texture for the tick callback and the close
+    # animation — replays just swap paintables. Repeated radii arrive as the
+    # same bytes object, so they share the previous texture.
     if window._blur_frames is None:
         window._blur_frames = []
-    window._blur_frames.append(frame)
-
-    if idx == 0:
-        # First frame (sharp) — show immediately
-        _display_frame(window, frame)
+    rgb_bytes, w, h = frame
+    if rgb_bytes is window._last_rgb:
+        texture = window._blur_frames[-1]
     else:
-        # Subsequent frames — show with eased delay
-        GLib.timeout_add(delay_ms, _display_frame_cb, window, frame, gen)
+        try:
+            texture = _rgb_to_texture(rgb_bytes, w, h)
+        except Exception as e:
+            logger.warning("Failed to build backdrop frame: %s", e)
+            return False
+        window._last_rgb = rgb_bytes
+    window._blur_frames.append(texture)
+
+    if not animate:
+        _display_frame(window, texture)
+    elif idx == 0:
+        _start_animation(window, _OPEN_DURATION_MS, reverse=False)
 
     return False
 
 
-def _display_frame(window, frame):
-    """Set a frame as the backdrop image."""
-    rgb_bytes, w, h = frame
-    try:
-        texture = _rgb_to_texture(rgb_bytes, w, h)
-        window._backdrop_picture.set_paintable(texture)
-        logger.debug(f"Backdrop: displayed frame {w}x{h} on monitor_idx={window.monitor}")
-    except Exception as e:
-        logger.warning(f"Failed to set backdrop frame: {e}")
+def _display_frame(window, texture):
+    """Set a cached frame texture as the backdrop image."""
+    window._backdrop_picture.set_paintable(texture)
+    # Runs once per vsync while animating — skip the GI size lookups
+    # unless the record will actually be emitted
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "Backdrop: displayed frame %dx%d on monitor_idx=%s",
+            texture.get_width(), texture.get_height(), window.monitor,
+        )
 
 
-def _display_frame_cb(window, frame, gen):
-    """GLib.timeout_add callback to display a frame (checks generation)."""
-    if window._anim_gen != gen:
-        return False
-    _display_frame(window, frame)
-    return False
+def _start_animation(window, duration_ms, reverse, on_done=None):
+    """Play the cached blur frames on the picture's frame clock.
+
+    Forward runs sharp → blurred with ease-in; reverse runs blurred →
+    sharp with ease-out. The tick callback fires once per vsync, so
+    frame changes land on real frames instead of wall-clock timers.
+    """
+    _stop_animation(window)
+    window._anim = {
+        "start_us": None,
+        "duration_us": duration_ms * 1000,
+        "reverse": reverse,
+        "on_done": on_done,
+        "shown": None,
+    }
+    window._tick_id = window._backdrop_picture.add_tick_callback(_on_tick, window)
+
+
+def _stop_animation(window):
+    """Cancel a running animation without firing its completion callback."""
+    if window._tick_id is not None:
+        window._backdrop_picture.remove_tick_callback(window._tick_id)
+        window._tick_id = None
+    window._anim = None
+
+
+def _on_tick(picture, frame_clock, window):
+    """Frame-clock tick: show the frame matching the elapsed, eased time."""
+    anim = window._anim
+    frames = window._blur_frames
+    if anim is None or not frames:
+        window._tick_id = None
+        return GLib.SOURCE_REMOVE
+
+    now = frame_clock.get_frame_time()
+    if anim["start_us"] is None:
+        anim["start_us"] = now
+    t = min(1.0, (now - anim["start_us"]) / anim["duration_us"])
+
+    if anim["reverse"]:
+        last = len(frames) - 1
+        idx = last - round(_ease_out(t) * last)
+    else:
+        # Frames may still be streaming in — clamp to what has arrived
+        idx = min(round(_ease_in(t) * (_BLUR_STEPS - 1)), len(frames) - 1)
+
+    if idx != anim["shown"]:
+        anim["shown"] = idx
+        _display_frame(window, frames[idx])
+
+    if t < 1.0:
+        return GLib.SOURCE_CONTINUE
+
+    window._tick_id = None
+    window._anim = None
+    if anim["on_done"]:
+        anim["on_done"]()
+    return GLib.SOURCE_REMOVE
 
 
 def _start_close_animation(window, on_done):
@@ -271,40 +464,11 @@ def _start_close_animation(window, on_done):
 
     window._closing = True
     window._anim_gen += 1
-    gen = window._anim_gen
 
     if window._blur_frames and len(window._blur_frames) > 1:
-        reversed_frames = list(reversed(window._blur_frames))
         # Reverse the easing — close starts fast, slows at end
-        intervals = list(reversed(_ease_in_intervals(_CLOSE_DURATION_MS, len(reversed_frames))))
-        _play_frame(window, reversed_frames, 0, gen, intervals, on_done)
+        _start_animation(window, _CLOSE_DURATION_MS, reverse=True, on_done=on_done)
     else:
+        _stop_animation(window)
         if on_done:
             on_done()
-
-
-def _play_frame(window, frames, idx, gen, intervals, on_done):
-    """Display a single animation frame, schedule the next one.
-
-    Used for close animation (open uses streaming instead).
-    """
-    if window._anim_gen != gen:
-        return False
-
-    _display_frame(window, frames[idx])
-
-    if idx + 1 < len(frames):
-        delay = intervals[idx] if idx < len(intervals) else intervals[-1]
-        GLib.timeout_add(delay, _play_frame, window, frames,
-                         idx + 1, gen, intervals, on_done)
-    elif on_done:
-        delay = intervals[-1] if intervals else 30
-        GLib.timeout_add(delay, _fire_callback, on_done)
-
-    return False
-
-
-def _fire_callback(callback):
-    """Wrapper for GLib.timeout_add callbacks."""
-    callback()
-    return False
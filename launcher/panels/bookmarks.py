@@ -9,29 +9,22 @@ Features:
 - Auto-saves changes
 """
 
-import os
-import sys
-
-from gi.repository import Gdk, GObject, Gtk
+from gi.repository import Gdk, GLib, GObject, Gtk
 from ignis.menu_model import IgnisMenuItem, IgnisMenuModel
 from ignis.services.applications import ApplicationsService
-
-from ignis import widgets
-
-# Add launcher directory to path dynamically (works from any location/worktree)
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from services.frecency import get_frecency_service
 from utils.helpers import (
-    clear_container,
+    create_icon,
     find_app_by_id,
     get_monitor_under_cursor,
     launch_app,
     load_bookmarks,
     load_settings,
-    save_bookmarks,
+    save_bookmarks_async,
 )
 
+from ignis import widgets
+
 
 class BookmarksPanel:
     """
@@ -45,13 +38,23 @@ class BookmarksPanel:
         self.frecency = get_frecency_service()
         self.settings = load_settings()
 
-        # Load bookmarks from JSON
-        bookmark_ids = load_bookmarks()
-        self.bookmarks = [app for app_id in bookmark_ids
-                          if (app := find_app_by_id(app_id))]
+        # Bookmarks are resolved on first show (see _ensure_populated), not
+        # at daemon startup — the launcher may never open this session
+        self.bookmarks = []
+        self._bookmark_ids = []  # Mirrors self.bookmarks; saved as-is
+        self._populated = False
+
+        # Row buttons, parallel to self.bookmarks — lets reorder/remove
+        # move or drop a single widget instead of rebuilding the list
+        self._row_widgets = []
 
         # Track drag state
         self.drag_source_index = None
+        self._drop_hover_row = None
+
+        # Debounced save: a burst of reorders/removals writes once
+        self._save_pending_ids = None
+        self._save_source_id = 0
 
     def create_window(self):
         """
@@ -64,15 +67,15 @@ class BookmarksPanel:
         Returns:
             widgets.Window positioned on left edge
         """
-        # Create scrollable app list
-        self.app_list_box = widgets.Box(
-            vertical=True,
-            spacing=3,
-            css_classes=["app-list"]
+        # Create scrollable app list (replaced wholesale on refresh)
+        self.app_list_box = self._create_list_box()
+        self._app_scroll = widgets.Scroll(
+            hexpand=True,
+            min_content_width=280,
+            propagate_natural_height=True,
+            child=self.app_list_box
         )
-
-        # Populate with bookmark buttons
-        self._refresh_app_list()
+        self._add_list_controllers(self._app_scroll)
 
         # Panel content
         content = widgets.Box(
@@ -89,12 +92,7 @@ class BookmarksPanel:
                             css_classes=["panel-header"],
                             halign="center"
                         ),
-                        widgets.Scroll(
-                            hexpand=True,
-                            min_content_width=280,
-                            propagate_natural_height=True,
-                            child=self.app_list_box
-                        )
+                        self._app_scroll,
                     ]
                 )
             ]
@@ -120,99 +118,195 @@ class BookmarksPanel:
 
         return window
 
+    def _add_list_controllers(self, scroll):
+        """
+        Attach one right-click gesture, drag source and drop target for all rows.
+
+        Controllers live on the Scroll, which survives list rebuilds; each
+        event resolves its row by picking the widget under the pointer.
+        """
+        # Right-click: show the row's context menu
+        gesture = Gtk.GestureClick()
+        gesture.set_button(3)  # Right click
+        gesture.connect("pressed", self._on_list_right_click)
+        scroll.add_controller(gesture)
+
+        # Drag source (capture phase so it sees presses before the row Button)
+        drag_source = Gtk.DragSource()
+        drag_source.set_actions(Gdk.DragAction.MOVE)
+        drag_source.set_propagation_phase(Gtk.PropagationPhase.CAPTURE)
+        drag_source.connect("prepare", self._on_list_drag_prepare)
+        drag_source.connect("drag-begin", self._on_drag_begin)
+        scroll.add_controller(drag_source)
+
+        # Drop target, with hover feedback following the row under the pointer
+        drop_target = Gtk.DropTarget.new(GObject.TYPE_INT, Gdk.DragAction.MOVE)
+        drop_target.connect("motion", self._on_list_drop_motion)
+        drop_target.connect("leave", self._on_list_drop_leave)
+        drop_target.connect("drop", self._on_list_drop)
+        scroll.add_controller(drop_target)
+
+    def _row_index_at(self, x, y):
+        """Return the bookmark index of the row under (x, y) in the Scroll, or None."""
+        widget = self._app_scroll.pick(x, y, Gtk.PickFlags.DEFAULT)
+        while widget is not None and widget is not self._app_scroll:
+            if getattr(widget, "_app", None) is not None:
+                # Walked up to a row; find where it sits in the list
+                try:
+                    return self._row_widgets.index(widget)
+                except ValueError:
+                    return None
+            widget = widget.get_parent()
+        return None
+
+    def _on_list_right_click(self, gesture, n_press, x, y):
+        """Right-click anywhere on a row opens its context menu."""
+        index = self._row_index_at(x, y)
+        if index is not None:
+            row = self._row_widgets[index]
+            self._show_context_menu(row._app, row)
+
+    def _on_list_drag_prepare(self, source, x, y):
+        """Start dragging the row under the pointer (no drag between rows)."""
+        index = self._row_index_at(x, y)
+        if index is None:
+            return None
+        return self._on_drag_prepare(index)
+
+    def _on_list_drop_motion(self, target, x, y):
+        """Track the hovered row while a drag moves over the list."""
+        index = self._row_index_at(x, y)
+        self._set_drop_hover(self._row_widgets[index] if index is not None else None)
+        return Gdk.DragAction.MOVE
+
+    def _on_list_drop_leave(self, target):
+        """Drag left the list — clear the hover highlight."""
+        self._set_drop_hover(None)
+
+    def _on_list_drop(self, target, value, x, y):
+        """Drop onto the row under the pointer."""
+        self._set_drop_hover(None)
+        index = self._row_index_at(x, y)
+        if index is None:
+            return False
+        return self._on_drop(index)
+
+    def _set_drop_hover(self, row):
+        """Move the drag-hover highlight to row (None clears it)."""
+        if row is self._drop_hover_row:
+            return
+        if self._drop_hover_row is not None:
+            self._on_drop_leave(self._drop_hover_row)
+        if row is not None:
+            self._on_drop_enter(row)
+        self._drop_hover_row = row
+
+    def _create_list_box(self):
+        """Create an empty container for bookmark rows."""
+        return widgets.Box(
+            vertical=True,
+            spacing=3,
+            css_classes=["app-list"]
+        )
+
     def _refresh_app_list(self):
-        """Rebuild the app list from current bookmarks."""
-        clear_container(self.app_list_box)
+        """
+        Rebuild the app list from current bookmarks.
+
+        Rows are appended to a detached box that then replaces the old one
+        in a single swap, so GTK styles and lays out the new subtree once
+        rather than once per appended row.
+        """
+        box = self._create_list_box()
+
+        self._row_widgets = []
+        for app in self.bookmarks:
+            button = self._create_app_button(app)
+            self._row_widgets.append(button)
+            box.append(button)
 
-        for index, app in enumerate(self.bookmarks):
-            button = self._create_app_button(app, index)
-            self.app_list_box.append(button)
+        self._app_scroll.set_child(box)
+        self.app_list_box = box
 
-    def _create_app_button(self, app, index):
+    def _create_app_button(self, app):
         """
-        Create a button for an app with drag-drop support.
+        Create a button for an app.
+
+        Right-click and drag-drop are handled by the list-level controllers
+        (see _add_list_controllers), so rows carry no controllers of their own.
 
         Args:
             app: Application object
-            index: Position in bookmark list
 
         Returns:
-            widgets.Button with icon, label, and drag-drop
+            widgets.Button with icon and label
         """
-        # Create context menu
-        menu = self._create_context_menu(app)
-
         # Main button
         button = widgets.Button(
             css_classes=["app-item"],
-            on_click=lambda x, app=app: self._on_app_click(app),
+            on_click=self._on_row_clicked,
             child=widgets.Box(
                 spacing=8,
                 child=[
                     # App icon on the left
-                    widgets.Icon(
-                        image=app.icon,
-                        pixel_size=48,
-                        css_classes=["app-icon"]
-                    ),
+                    create_icon(app.icon, 48),
                     # App name and description (left-aligned, no truncation)
                     widgets.Box(
                         vertical=True,
                         vexpand=True,
                         hexpand=True,
                         valign="center",
-                        child=[
-                            widgets.Label(
-                                label=app.name,
-                                css_classes=["app-name"],
-                                halign="start",
-                                wrap=True,
-                                xalign=0.0
-                            ),
-                            widgets.Label(
-                                label=app.description or "",
-                                css_classes=["app-description"],
-                                halign="start",
-                                wrap=True,
-                                wrap_mode="word_char",
-                                lines=2,
-                                xalign=0.0
-                            )
-                        ]
+                        child=self._create_labels(app),
                     ),
-                    # Hidden context menu (must be child of button content)
-                    menu
                 ]
             )
         )
+        button._app = app     # Read by the shared handlers, no per-row closures
+        button._menu = None   # Context menu, built on first right-click
+        return button
 
-        # Add right-click handler to show context menu
-        gesture = Gtk.GestureClick()
-        gesture.set_button(3)  # Right click
-        gesture.connect("pressed", lambda g, n, x, y, m=menu: m.popup())
-        button.add_controller(gesture)
-
-        # Add drag source
-        drag_source = Gtk.DragSource()
-        drag_source.set_actions(Gdk.DragAction.MOVE)
-        drag_source.connect("prepare", lambda src, x, y, idx=index: self._on_drag_prepare(idx))
-        drag_source.connect("drag-begin", lambda src, drag: self._on_drag_begin())
-        button.add_controller(drag_source)
-
-        # Add drop target
-        drop_target = Gtk.DropTarget.new(GObject.TYPE_STRING, Gdk.DragAction.MOVE)
-        drop_target.connect("drop", lambda tgt, val, x, y, idx=index: self._on_drop(idx))
-        drop_target.connect("enter", lambda tgt, x, y: self._on_drop_enter(button))
-        drop_target.connect("leave", lambda tgt: self._on_drop_leave(button))
-        button.add_controller(drop_target)
+    def _create_labels(self, app):
+        """Create the name label, plus a description label only if there is one."""
+        labels = [
+            widgets.Label(
+                label=app.name,
+                css_classes=["app-name"],
+                halign="start",
+                wrap=True,
+                xalign=0.0
+            )
+        ]
+        if app.description:
+            labels.append(
+                widgets.Label(
+                    label=app.description,
+                    css_classes=["app-description"],
+                    halign="start",
+                    wrap=True,
+                    wrap_mode="word_char",
+                    lines=2,
+                    xalign=0.0
+                )
+            )
+        return labels
 
-        return button
+    def _on_row_clicked(self, button):
+        """Row button clicked — launch its app."""
+        self._on_app_click(button._app)
 
     def _on_app_click(self, app):
         """Launch app when clicked."""
         close_delay = self.settings["launcher"]["close_delay_ms"]
         launch_app(app, self.frecency, close_delay)
 
+    def _show_context_menu(self, app, button):
+        """Pop up a row's context menu, building it on first use."""
+        if button._menu is None:
+            # Hidden context menu (must be child of button content)
+            button._menu = self._create_context_menu(app)
+            button.get_child().append(button._menu)
+        button._menu.popup()
+
     def _create_context_menu(self, app):
         """Create context menu for a bookmarked app."""
         return widgets.PopoverMenu(
@@ -226,26 +320,56 @@ class BookmarksPanel:
 
     def _remove_from_bookmarks(self, app):
         """Remove app from bookmarks."""
+        try:
+            index = self._bookmark_ids.index(app.id)
+        except ValueError:
+            return
+
         # Remove from list
-        self.bookmarks = [a for a in self.bookmarks if a.id != app.id]
+        self.bookmarks.pop(index)
+        self._bookmark_ids.pop(index)
 
         # Save to disk
-        bookmark_ids = [a.id for a in self.bookmarks]
-        save_bookmarks(bookmark_ids)
-
-        # Refresh UI
-        self._refresh_app_list()
+        self._queue_save(self._bookmark_ids)
+
+        # Drop just this row — the others are unchanged
+        self.app_list_box.remove(self._row_widgets.pop(index))
+
+    def _queue_save(self, bookmark_ids):
+        """Schedule a bookmarks write, coalescing changes within 150ms."""
+        self._save_pending_ids = bookmark_ids
+        if not self._save_source_id:
+            self._save_source_id = GLib.timeout_add(150, self._on_save_timeout)
+
+    def _on_save_timeout(self):
+        """Debounce timer fired — write the latest pending order."""
+        self._save_source_id = 0
+        self._flush_save()
+        return GLib.SOURCE_REMOVE
+
+    def flush_save(self):
+        """Write any pending bookmark change to disk now (can be called externally)."""
+        if self._save_source_id:
+            GLib.source_remove(self._save_source_id)
+            self._save_source_id = 0
+        self._flush_save()
+
+    def _flush_save(self):
+        """Write the pending bookmark order, if any (off the main thread)."""
+        if self._save_pending_ids is not None:
+            save_bookmarks_async(self._save_pending_ids)
+            self._save_pending_ids = None
 
     # Drag-and-drop handlers
 
     def _on_drag_prepare(self, index):
         """Prepare drag operation."""
         self.drag_source_index = index
-        # Return content provider with app ID
-        app_id = self.bookmarks[index].id
-        return Gdk.ContentProvider.new_for_value(GObject.Value(str, app_id))
+        # The drop side reads drag_source_index; the payload only has to
+        # match the DropTarget's type, so send the index as a plain int
+        return Gdk.ContentProvider.new_for_value(GObject.Value(int, index))
 
-    def _on_drag_begin(self):
+    def _on_drag_begin(self, source, drag):
         """Drag operation started."""
         pass
 
@@ -262,25 +386,30 @@ class BookmarksPanel:
         if self.drag_source_index is None:
             return False
 
-        # Don't do anything if dropping in same place
-        if self.drag_source_index == drop_index:
+        # Don't do anything if dropping in same place — dropping onto the
+        # next row is the same place too, once the source is popped
+        if drop_index in (self.drag_source_index, self.drag_source_index + 1):
             return True
 
         # Reorder bookmarks list
         app = self.bookmarks.pop(self.drag_source_index)
+        app_id = self._bookmark_ids.pop(self.drag_source_index)
+        row = self._row_widgets.pop(self.drag_source_index)
 
         # Adjust target index if needed
         if self.drag_source_index < drop_index:
             drop_index -= 1
 
         self.bookmarks.insert(drop_index, app)
+        self._bookmark_ids.insert(drop_index, app_id)
+        self._row_widgets.insert(drop_index, row)
 
         # Save new order
-        bookmark_ids = [a.id for a in self.bookmarks]
-        save_bookmarks(bookmark_ids)
+        self._queue_save(self._bookmark_ids)
 
-        # Refresh UI
-        self._refresh_app_list()
+        # Move the dragged row in place instead of rebuilding every row
+        sibling = self._row_widgets[drop_index - 1] if drop_index > 0 else None
+        self.app_list_box.reorder_child_after(row, sibling)
 
         return True
 
@@ -294,12 +423,23 @@ class BookmarksPanel:
 
     def refresh_from_disk(self):
         """Reload bookmarks from disk and refresh UI (can be called externally)."""
+        self.flush_save()
         bookmark_ids = load_bookmarks()
         self.bookmarks = [app for app_id in bookmark_ids
                           if (app := find_app_by_id(app_id))]
+        self._bookmark_ids = [app.id for app in self.bookmarks]
+        self._populated = True
         self._refresh_app_list()
 
+    def _ensure_populated(self):
+        """Load bookmarks and build rows the first time the panel is shown."""
+        if not self._populated:
+            self.refresh_from_disk()
+
     def _on_visibility_changed(self, window, param):
-        """Handle visibility changes — refresh bookmarks on open."""
+        """Handle visibility changes — populate on first open."""
         if window.get_visible():
-            pass  # Monitor set by toggle_launcher() before visibility
+            # Monitor set by toggle_launcher() before visibility
+            self._ensure_populated()
+        else:
+            self.flush_save()
@@ -8,28 +8,21 @@ Features:
 - Right-click context menu: remove from frequents, add to bookmarks
 """
 
-import os
-import sys
-
-from gi.repository import Gtk
+from gi.repository import GLib, Gtk
 from ignis.menu_model import IgnisMenuItem, IgnisMenuModel
 from ignis.services.applications import ApplicationsService
-
-from ignis import widgets
-
-# Add launcher directory to path dynamically (works from any location/worktree)
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from services.frecency import get_frecency_service
 from utils.helpers import (
     add_bookmark_with_refresh,
-    clear_container,
     find_app_by_id,
     get_monitor_under_cursor,
     launch_app,
     load_settings,
+    low_fx_enabled,
 )
 
+from ignis import widgets
+
 
 class FrequentPanel:
     """
@@ -42,39 +35,35 @@ class FrequentPanel:
         self.apps_service = ApplicationsService.get_default()
         self.frecency = get_frecency_service()
 
-        # Connect to frecency changes
-        self.frecency.connect("changed", lambda x: self._refresh_apps())
+        # Connect to frecency changes (debounced — bursts refresh once)
+        self._refresh_pending_id = 0
+        self._stale = False  # A change arrived that the rows don't show yet
+        self.frecency.connect("changed", self._on_frecency_changed)
+        self.apps_service.connect("notify::apps", self._on_apps_changed)
 
         # Load settings
         self.settings = load_settings()
         self.max_items = self.settings["frecency"]["max_items"]
         self.min_launches = self.settings["frecency"]["min_launches"]
+        self._close_delay_ms = self.settings["launcher"]["close_delay_ms"]
+
+        # Top apps are queried on idle after startup or on first show (see
+        # _ensure_populated), never in the constructor
+        self.top_apps = []
+        self._populated = False
 
-        # Load top apps
-        self.top_apps = self._get_top_apps()
+        # (app, launch_count) of the rows currently shown
+        self._last_fingerprint = None
 
         # Widgets (created in create_window)
         self.app_list_box = None
+        self._rows = {}            # app_id → row button, in the list box
+        self._empty_label = None   # Shown when there are no frequent apps
 
-    def _get_top_apps(self):
-        """
-        Get top apps from frecency service.
-
-        Returns:
-            List of tuples: (app, frecency_score, launch_count)
-        """
-        top_data = self.frecency.get_top_apps(
-            limit=self.max_items,
-            min_launches=self.min_launches
-        )
-
-        apps = []
-        for app_id, score, count, _last_launch in top_data:
-            app = find_app_by_id(app_id)
-            if app:
-                apps.append((app, score, count))
-
-        return apps
+        # One context menu shared by all rows, moved to the clicked row
+        self._menu = None
+        self._menu_app = None
+        self._menu_button = None
 
     def create_window(self):
         """
@@ -94,8 +83,19 @@ class FrequentPanel:
             css_classes=["app-list"]
         )
 
-        # Populate with frequent apps
-        self._refresh_app_list()
+        self._app_scroll = widgets.Scroll(
+            hexpand=True,
+            min_content_width=280,
+            propagate_natural_height=True,
+            child=self.app_list_box
+        )
+
+        # Right-click: one gesture for all rows, on the Scroll (which
+        # outlives row changes); each press resolves the row under it
+        gesture = Gtk.GestureClick()
+        gesture.set_button(3)  # Right click
+        gesture.connect("pressed", self._on_list_right_click)
+        self._app_scroll.add_controller(gesture)
 
         # Panel content
         content = widgets.Box(
@@ -112,12 +112,7 @@ class FrequentPanel:
                             css_classes=["panel-header"],
                             halign="center"
                         ),
-                        widgets.Scroll(
-                            hexpand=True,
-                            min_content_width=280,
-                            propagate_natural_height=True,
-                            child=self.app_list_box
-                        )
+                        self._app_scroll,
                     ]
                 )
             ]
@@ -125,7 +120,7 @@ class FrequentPanel:
 
         window = widgets.Window(
             namespace="ignomi-frequent",
-            css_classes=["ignomi-window"],
+            css_classes=["ignomi-window", "lowfx"] if low_fx_enabled() else ["ignomi-window"],
             monitor=get_monitor_under_cursor(),
             anchor=["right", "top", "bottom"],
             exclusivity="ignore",
@@ -141,30 +136,118 @@ class FrequentPanel:
 
         window.connect("notify::visible", self._on_visibility_changed)
 
+        # Fill the list once the main loop goes idle after startup, so the
+        # first open doesn't wait on the frecency query and row building
+        GLib.idle_add(self._on_idle_prefetch, priority=GLib.PRIORITY_DEFAULT_IDLE)
+
         return window
 
+    def _on_idle_prefetch(self):
+        """Idle callback — populate ahead of the first show."""
+        self._ensure_populated()
+        return GLib.SOURCE_REMOVE
+
+    def _on_frecency_changed(self, service):
+        """Launch stats changed — refresh the rows."""
+        self._schedule_refresh()
+
+    def _on_apps_changed(self, *_args):
+        """Installed apps changed — rows may hold replaced app objects."""
+        self._schedule_refresh()
+
+    def _schedule_refresh(self):
+        """Schedule a refresh, coalescing changes that arrive within 50ms."""
+        self._stale = True
+        if not self._refresh_pending_id:
+            self._refresh_pending_id = GLib.timeout_add(50, self._do_refresh)
+
+    def _do_refresh(self):
+        """Debounce timer fired — refresh once for the whole burst."""
+        self._refresh_pending_id = 0
+        # While hidden, leave it stale; the next show refreshes
+        if self._app_scroll.get_mapped():
+            self._refresh_apps()
+        return GLib.SOURCE_REMOVE
+
     def _refresh_apps(self):
-        """Callback when frecency data changes."""
-        self.top_apps = self._get_top_apps()
+        """Re-query top apps and rebuild the list."""
+        if not self._populated:
+            return  # Built fresh on first show
+        self._stale = False
+
+        top_apps = self.frecency.get_top_apps_resolved(
+            limit=self.max_items,
+            min_launches=self.min_launches,
+            resolver=find_app_by_id,
+        )
+
+        # Scores drift with time, but the rows only show order and counts
+        # (and hold the app objects) — skip the rebuild when none changed
+        fingerprint = tuple((app, count) for app, _score, count in top_apps)
+        if fingerprint == self._last_fingerprint:
+            return
+        self._last_fingerprint = fingerprint
+
+        self.top_apps = top_apps
         self._refresh_app_list()
 
+    def _ensure_populated(self):
+        """Query top apps and build rows the first time the panel is shown."""
+        if not self._populated:
+            self._populated = True
+            self._refresh_apps()
+
     def _refresh_app_list(self):
-        """Rebuild the app list from current top apps."""
-        clear_container(self.app_list_box)
+        """
+        Update the app list from current top apps, keyed by app id.
 
-        # Add frequent app buttons
-        if self.top_apps:
-            for app, _score, count in self.top_apps:
+        Rows for apps still in the list are kept and only have their count
+        badge updated and position fixed; only new apps, or apps the
+        service replaced with a new object, get new rows.
+        """
+        wanted = {app.id: app for app, _score, _count in self.top_apps}
+        for app_id in [
+            app_id for app_id, button in self._rows.items()
+            if wanted.get(app_id) is not button._app
+        ]:
+            self.app_list_box.remove(self._rows.pop(app_id))
+
+        if not self.top_apps:
+            # Show empty state
+            if self._empty_label is None:
+                self._empty_label = widgets.Label(
+                    label="No frequent apps yet\n\nLaunch apps to build history",
+                    css_classes=["empty-state"],
+                    justify="center"
+                )
+                self.app_list_box.append(self._empty_label)
+            return
+
+        if self._empty_label is not None:
+            self.app_list_box.remove(self._empty_label)
+            self._empty_label = None
+
+        # Filling from scratch: detach the box so GTK styles and lays out
+        # the new rows once on reattach, not once per append
+        detached = not self._rows
+        if detached:
+            self._app_scroll.set_child(None)
+
+        previous = None
+        for app, _score, count in self.top_apps:
+            button = self._rows.get(app.id)
+            if button is None:
                 button = self._create_app_button(app, count)
+                self._rows[app.id] = button
                 self.app_list_box.append(button)
-        else:
-            # Show empty state
-            empty_label = widgets.Label(
-                label="No frequent apps yet\n\nLaunch apps to build history",
-                css_classes=["empty-state"],
-                justify="center"
-            )
-            self.app_list_box.append(empty_label)
+            else:
+                button._count_label.set_label(f"{count}×")
+            if button.get_prev_sibling() is not previous:
+                self.app_list_box.reorder_child_after(button, previous)
+            previous = button
+
+        if detached:
+            self._app_scroll.set_child(self.app_list_box)
 
     def _create_app_button(self, app, launch_count):
         """
@@ -177,11 +260,19 @@ class FrequentPanel:
         Returns:
             widgets.Button with icon, label, and usage badge
         """
-        # Content box (will hold menu after button creation)
+        # Launch count badge (kept on the button, updated in place on refresh)
+        count_label = widgets.Label(
+            label=f"{launch_count}×",
+            css_classes=["frecency-count"],
+            halign="center"
+        )
+
+        # Content box (hosts the shared context menu while it is open here)
         content_box = widgets.Box(
             spacing=8,
             child=[
-                # App name and description (right-aligned, no truncation)
+                # App name and description (right-aligned, single line,
+                # ellipsized — one Pango measure instead of re-wrapping)
                 widgets.Box(
                     vertical=True,
                     vexpand=True,
@@ -192,16 +283,18 @@ class FrequentPanel:
                             label=app.name,
                             css_classes=["app-name"],
                             halign="end",
-                            wrap=True,
+                            ellipsize="end",
+                            single_line_mode=True,
+                            max_width_chars=30,
                             xalign=1.0
                         ),
                         widgets.Label(
                             label=app.description or "",
                             css_classes=["app-description"],
                             halign="end",
-                            wrap=True,
-                            wrap_mode="word_char",
-                            lines=2,
+                            ellipsize="end",
+                            single_line_mode=True,
+                            max_width_chars=30,
                             xalign=1.0
                         )
                     ]
@@ -218,11 +311,7 @@ class FrequentPanel:
                             pixel_size=48,
                             css_classes=["app-icon"]
                         ),
-                        widgets.Label(
-                            label=f"{launch_count}×",
-                            css_classes=["frecency-count"],
-                            halign="center"
-                        )
+                        count_label,
                     ]
                 )
             ]
@@ -230,41 +319,69 @@ class FrequentPanel:
 
         button = widgets.Button(
             css_classes=["app-item"],
-            on_click=lambda x, app=app: self._on_app_click(app),
+            on_click=self._on_row_clicked,
             child=content_box
         )
-
-        # Create context menu (after button exists for visual feedback reference)
-        menu = self._create_context_menu(app, button)
-        content_box.append(menu)
-
-        # Add right-click handler to show context menu
-        gesture = Gtk.GestureClick()
-        gesture.set_button(3)  # Right click
-        gesture.connect("pressed", lambda g, n, x, y, m=menu: m.popup())
-        button.add_controller(gesture)
+        button._app = app
+        button._count_label = count_label
 
         return button
 
-    def _create_context_menu(self, app, button):
-        """Create context menu for a frequent app."""
+    def _on_row_clicked(self, button):
+        """Row button clicked — launch its app."""
+        self._on_app_click(button._app)
+
+    def _row_at(self, x, y):
+        """Return the row button under (x, y) in the Scroll, or None."""
+        widget = self._app_scroll.pick(x, y, Gtk.PickFlags.DEFAULT)
+        while widget is not None and widget is not self._app_scroll:
+            app = getattr(widget, "_app", None)
+            if app is not None and self._rows.get(app.id) is widget:
+                return widget
+            widget = widget.get_parent()
+        return None
+
+    def _on_list_right_click(self, gesture, n_press, x, y):
+        """Right-click anywhere on a row opens the context menu for its app."""
+        button = self._row_at(x, y)
+        if button is not None:
+            self._show_context_menu(button._app, button)
+
+    def _show_context_menu(self, app, button):
+        """Point the shared context menu at a row and pop it up."""
+        if self._menu is None:
+            self._menu = self._create_context_menu()
+
+        # Menu must be a child of the row content to anchor to it
+        content = button.get_child()
+        parent = self._menu.get_parent()
+        if parent is not content:
+            if parent is not None:
+                parent.remove(self._menu)
+            content.append(self._menu)
+
+        self._menu_app = app
+        self._menu_button = button
+        self._menu.popup()
+
+    def _create_context_menu(self):
+        """Create the context menu; items act on the row it was opened for."""
         return widgets.PopoverMenu(
             model=IgnisMenuModel(
                 IgnisMenuItem(
                     label="Remove from frequents",
-                    on_activate=lambda x, a=app: self._remove_from_frequents(a),
+                    on_activate=lambda x: self._remove_from_frequents(self._menu_app),
                 ),
                 IgnisMenuItem(
                     label="Add to bookmarks",
-                    on_activate=lambda x, a=app, b=button: self._add_to_bookmarks(a, b),
+                    on_activate=lambda x: self._add_to_bookmarks(self._menu_app, self._menu_button),
                 ),
             )
         )
 
     def _on_app_click(self, app):
         """Launch app when clicked."""
-        close_delay = self.settings["launcher"]["close_delay_ms"]
-        launch_app(app, self.frecency, close_delay)
+        launch_app(app, self.frecency, self._close_delay_ms)
 
     def _remove_from_frequents(self, app):
         """Remove app from frecency tracking."""
@@ -276,6 +393,12 @@ class FrequentPanel:
         add_bookmark_with_refresh(app.id, button)
 
     def _on_visibility_changed(self, window, param):
-        """Handle visibility changes."""
+        """Handle visibility changes — populate on first open, then catch up."""
         if window.get_visible():
-            pass  # Monitor set by toggle_launcher() before visibility
+            # Monitor set by toggle_launcher() before visibility
+            if not self._populated:
+                self._ensure_populated()
+            elif self._stale and not self._refresh_pending_id:
+                # Rows persist across show/hide; only re-query when launch
+                # stats changed while the panel was hidden
+                self._refresh_apps()
@@ -10,17 +10,12 @@ Features:
 - Clear search term when launcher closes (with close guard)
 """
 
-import os
-import sys
+import time
+from collections import OrderedDict
 
 from gi.repository import Gdk, GLib, Gtk
 from ignis.services.applications import ApplicationsService
-
-from ignis import widgets
-
-# Add launcher directory to path dynamically (works from any location/worktree)
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
+from ignis.services.hyprland import HyprlandService
 from search.handlers import (
     AppSearchHandler,
     CalculatorHandler,
@@ -32,11 +27,15 @@ from search.router import QueryRouter, ResultItem
 from services.frecency import get_frecency_service
 from utils.helpers import (
     add_bookmark_with_refresh,
+    close_launcher,
+    create_icon,
     get_monitor_under_cursor,
     launch_app,
     load_settings,
 )
 
+from ignis import widgets
+
 
 class SearchPanel:
     """
@@ -46,9 +45,16 @@ class SearchPanel:
     produces the results. App search is the fallback.
     """
 
+    ROW_CACHE_SIZE = 256
+    QUERY_CACHE_SIZE = 64
+    DEBOUNCE_MS = 120
+    FIRST_PAINT_ROWS = 8   # Placed synchronously; the rest fill in on idle
+    FILL_BATCH_ROWS = 4
+
     def __init__(self):
         self.apps_service = ApplicationsService.get_default()
         self.frecency = get_frecency_service()
+        self.hyprland = HyprlandService.get_default()
         self.settings = load_settings()
 
         # Initialize query router with handlers (priority order)
@@ -61,19 +67,43 @@ class SearchPanel:
         self.router.register(AppSearchHandler(           # 1000: app search (fallback)
             max_results=search_settings.get("max_results", 30),
             fuzzy_threshold=search_settings.get("fuzzy_threshold", 50),
+            frecency=self.frecency,
         ))
 
         # Current results from router
         self.current_results: list[ResultItem] = []
         self.current_handler = "app_search"
 
+        # Routed (handler, results) by query, least recently used first;
+        # app results go stale when the installed apps change
+        self._last_query = None
+        self._query_cache: OrderedDict[str, tuple[str, list[ResultItem]]] = OrderedDict()
+        self._empty_results = None  # Defaults for an empty entry, built on first use
+        self.apps_service.connect("notify::apps", self._on_apps_changed)
+        self.frecency.connect("changed", self._on_frecency_changed)
+
         # Widgets (created in create_window)
         self.search_entry = None
         self.results_box = None
+        self._results_scroll = None
         self._revealer = None
 
+        # Rows placed in results_box for current_results, in order. While an
+        # idle fill is pending this is a prefix of the results.
+        self._rows = []
+        self._fill_seen = set()
+        self._fill_source_id = 0
+        # Built rows by result key, least recently shown first — a result
+        # that comes back in a later query reuses its row
+        self._row_cache = OrderedDict()
+
+        # Cursor target over the entry per Ignis monitor index, or None when
+        # the monitor isn't known to Hyprland (built on first focus grab)
+        self._focus_points: dict[int, tuple[int, int] | None] | None = None
+
         # Debounce and close guard
         self._debounce_timer = None
+        self._last_change = 0.0  # time.monotonic() of the latest keystroke
         self._closing = False
 
     def create_window(self):
@@ -102,8 +132,18 @@ class SearchPanel:
             css_classes=["search-results"],
         )
 
-        # Initial population
-        self._do_search()
+        # Right-click: add to bookmarks — one gesture for the whole list
+        gesture_right = Gtk.GestureClick()
+        gesture_right.set_button(3)
+        gesture_right.connect("pressed", self._on_results_right_click)
+        self.results_box.add_controller(gesture_right)
+
+        self._results_scroll = widgets.Scroll(
+            hexpand=True,
+            max_content_height=500,
+            propagate_natural_height=True,
+            child=self.results_box
+        )
 
         # Panel content (no vexpand/valign — Revealer controls sizing)
         panel_content = widgets.Box(
@@ -111,12 +151,7 @@ class SearchPanel:
             css_classes=["panel", "search-panel"],
             child=[
                 self.search_entry,
-                widgets.Scroll(
-                    hexpand=True,
-                    max_content_height=500,
-                    propagate_natural_height=True,
-                    child=self.results_box
-                )
+                self._results_scroll,
             ]
         )
 
@@ -173,93 +208,224 @@ class SearchPanel:
                 window.set_visible(False)
 
     def _on_search_changed(self):
-        """Debounced search — waits 120ms after last keystroke."""
+        """Debounced search — runs 120ms after the last keystroke."""
         if self._closing:
             return
-        if self._debounce_timer is not None:
-            GLib.source_remove(self._debounce_timer)
-        self._debounce_timer = GLib.timeout_add(120, self._do_search)
+        # Keystrokes only stamp the time; one timer per burst checks it
+        self._last_change = time.monotonic()
+        if self._debounce_timer is None:
+            self._debounce_timer = GLib.timeout_add(self.DEBOUNCE_MS, self._on_debounce_timeout)
+
+    def _on_debounce_timeout(self):
+        """Search if typing has paused, else wait out the rest of the delay."""
+        remaining_ms = int((self._last_change - time.monotonic()) * 1000) + self.DEBOUNCE_MS
+        if remaining_ms > 0:
+            self._debounce_timer = GLib.timeout_add(remaining_ms, self._on_debounce_timeout)
+            return False
+        return self._do_search()
 
     def _do_search(self):
         """Execute the actual search query (called after debounce)."""
         self._debounce_timer = None
         query = self.search_entry.text if self.search_entry else ""
-        self.current_handler, self.current_results = self.router.route(query)
+        if query == self._last_query:
+            return False  # Results already shown
+        self._last_query = query
+
+        if not query.strip():
+            # Shown on every open — skip the router and the LRU
+            if self._empty_results is None:
+                self._empty_results = self.router.route("")
+            cached = self._empty_results
+        # Keyed on the raw query: app matching ignores case, but other
+        # handlers don't ("G: x" is an app search, "g: x" a web search,
+        # "= PI" and "= pi" evaluate differently), so "Fire" and "fire"
+        # can't share an entry before the router has picked a handler
+        elif (cached := self._query_cache.get(query)) is None:
+            cached = self.router.route(query)
+            # Control results depend on live service state — route them anew
+            if not any(result.widget_builder for result in cached[1]):
+                self._query_cache[query] = cached
+                if len(self._query_cache) > self.QUERY_CACHE_SIZE:
+                    self._query_cache.popitem(last=False)
+        else:
+            self._query_cache.move_to_end(query)
+
+        self.current_handler, self.current_results = cached
         self._update_results()
         return False  # Don't repeat GLib timeout
 
+    def _on_frecency_changed(self, *_args):
+        """Launch stats changed — the empty-query defaults are re-ranked."""
+        self._empty_results = None
+        self._last_query = None
+
+    def _on_apps_changed(self, *_args):
+        """Installed apps changed — drop memoized results and rows."""
+        self._query_cache.clear()
+        self._empty_results = None
+        self._last_query = None
+        # Cached app rows show the old name/icon and hold the old app object
+        self._row_cache.clear()
+
     def _update_results(self):
-        """Rebuild results list from current ResultItem list."""
-        self.results_box.remove_all()
-
-        for result in self.current_results:
-            if result.widget_builder:
-                widget = result.widget_builder()
-                row = widgets.ListBoxRow(child=widget)
-                self.results_box.append(row)
+        """
+        Update the results list from current_results, keyed by result.
+
+        Rows for results still present are kept (and moved if their position
+        changed); rows for returning results come from the row cache; only
+        results never shown before get new rows. The first rows are placed
+        right away so they paint in the next frame; the rest are placed in
+        small batches on idle.
+        """
+        if self._fill_source_id:
+            GLib.source_remove(self._fill_source_id)
+            self._fill_source_id = 0
+
+        # Drop rows for results that are gone (or aren't the cached row for
+        # their key, like control rows) before the first paint
+        wanted = {self._result_key(result) for result in self.current_results}
+        idx = 0
+        while (row := self.results_box.get_row_at_index(idx)) is not None:
+            key = getattr(row, "_key", None)
+            if key in wanted and self._row_cache.get(key) is row:
+                idx += 1
             else:
-                row = self._create_result_row(result)
-                self.results_box.append(row)
+                self.results_box.remove(row)
 
-        rows = self.results_box.rows
-        if rows:
-            self.results_box.select_row(rows[0])
+        # Filling an empty list: detach it so GTK styles and lays out the
+        # first rows once on reattach, not once per insert
+        detached = self.results_box.get_row_at_index(0) is None
+        if detached:
+            self._results_scroll.set_child(None)
+
+        self._rows = []
+        self._fill_seen = set()
+        for result in self.current_results[:self.FIRST_PAINT_ROWS]:
+            self._place_result(result)
+
+        if detached:
+            self._results_scroll.set_child(self.results_box)
+
+        if self._rows:
+            self.results_box.select_row(self._rows[0])
+
+        if len(self._rows) < len(self.current_results):
+            self._fill_source_id = GLib.idle_add(self._on_fill_idle)
+        else:
+            self._finish_fill()
+
+    def _on_fill_idle(self):
+        """Place the next batch of result rows."""
+        start = len(self._rows)
+        for result in self.current_results[start:start + self.FILL_BATCH_ROWS]:
+            self._place_result(result)
+        if len(self._rows) < len(self.current_results):
+            return GLib.SOURCE_CONTINUE
+        self._fill_source_id = 0
+        self._finish_fill()
+        return GLib.SOURCE_REMOVE
+
+    def _place_result(self, result: ResultItem):
+        """Put the (cached or new) row for a result at the next index."""
+        cache = self._row_cache
+        key = self._result_key(result)
+        if result.widget_builder:
+            # Control widgets read volume/brightness once when built, so a
+            # kept row would show stale values — build a fresh one each time
+            row = self._build_row(result)
+        else:
+            row = cache.get(key)
+            if row is None or key in self._fill_seen:
+                row = self._build_row(result)
+                if key not in self._fill_seen:
+                    cache[key] = row
+            self._fill_seen.add(key)
+            cache.move_to_end(key)
+        row._key = key
+        row._result = result  # Read by the activate/right-click handlers
+
+        idx = len(self._rows)
+        if row.get_parent() is None:
+            self.results_box.insert(row, idx)
+        elif row.get_index() != idx:
+            self.results_box.remove(row)
+            self.results_box.insert(row, idx)
+        self._rows.append(row)
+
+    def _finish_fill(self):
+        """All results placed — drop leftover rows and trim the row cache."""
+        while (row := self.results_box.get_row_at_index(len(self._rows))) is not None:
+            self.results_box.remove(row)
+
+        cache = self._row_cache
+        while len(cache) > self.ROW_CACHE_SIZE:
+            cache.popitem(last=False)
+
+    @staticmethod
+    def _result_key(result: ResultItem):
+        """Identity of a result across queries — app id, else its content."""
+        if result.app is not None:
+            return ("app", result.app.id)
+        return (result.result_type, result.title, result.description, result.icon)
+
+    def _build_row(self, result: ResultItem):
+        """Build the ListBoxRow for a result."""
+        if result.widget_builder:
+            return widgets.ListBoxRow(child=result.widget_builder())
+        return self._create_result_row(result)
 
     def _create_result_row(self, result: ResultItem):
-        """Create a ListBoxRow for a search result."""
-        row = widgets.ListBoxRow(
-            css_classes=["app-item", "result-item", f"result-{result.result_type}"],
-            child=widgets.Box(
+        """
+        Create a ListBoxRow for a search result.
+
+        Results without a description get just the icon and title, without
+        the empty label and the vertical box around it.
+        """
+        content = widgets.Box(
+            spacing=8,
+            halign="center",
+            valign="center",
+            child=[
+                create_icon(result.icon, 24),
+                widgets.Label(
+                    label=result.title,
+                    css_classes=["app-name", "search-app-name"],
+                    ellipsize="end",
+                    max_width_chars=35,
+                ),
+            ],
+        )
+        if result.description:
+            content = widgets.Box(
+                vertical=True,
+                spacing=4,
                 halign="center",
                 child=[
-                    widgets.Box(
-                        vertical=True,
-                        spacing=4,
-                        child=[
-                            widgets.Box(
-                                spacing=8,
-                                halign="center",
-                                valign="center",
-                                child=[
-                                    widgets.Icon(
-                                        image=result.icon,
-                                        pixel_size=24,
-                                        css_classes=["app-icon"],
-                                    ),
-                                    widgets.Label(
-                                        label=result.title,
-                                        css_classes=["app-name", "search-app-name"],
-                                        ellipsize="end",
-                                        max_width_chars=35,
-                                    ),
-                                ],
-                            ),
-                            widgets.Label(
-                                label=result.description,
-                                css_classes=["app-description", "search-app-description"],
-                                halign="center",
-                                xalign=0.5,
-                                ellipsize="end",
-                                max_width_chars=45,
-                            ),
-                        ],
-                    )
+                    content,
+                    widgets.Label(
+                        label=result.description,
+                        css_classes=["app-description", "search-app-description"],
+                        halign="center",
+                        xalign=0.5,
+                        ellipsize="end",
+                        max_width_chars=45,
+                    ),
                 ],
-            ),
-            on_activate=lambda r, result=result: self._activate_result(result),
-        )
-
-        # Right-click: add to bookmarks (only for app results)
-        if result.result_type == "app" and result.app:
-            gesture_right = Gtk.GestureClick()
-            gesture_right.set_button(3)
-            gesture_right.connect(
-                "pressed",
-                lambda g, n, x, y, r=result, rw=row: add_bookmark_with_refresh(r.app.id, rw)
             )
-            row.add_controller(gesture_right)
 
-        return row
+        return widgets.ListBoxRow(
+            css_classes=["app-item", "result-item", f"result-{result.result_type}"],
+            child=content,
+            on_activate=lambda r: self._activate_result(r._result),
+        )
+
+    def _on_results_right_click(self, gesture, n_press, x, y):
+        """Right-click on an app result adds it to bookmarks."""
+        row = self.results_box.get_row_at_y(int(y))
+        result = getattr(row, "_result", None)
+        if result is not None and result.result_type == "app" and result.app:
+            add_bookmark_with_refresh(result.app.id, row)
 
     def _activate_result(self, result: ResultItem):
         """Activate a result item — launch app or call custom handler."""
@@ -276,47 +442,51 @@ class SearchPanel:
         if window.get_visible():
             # Monitor set by toggle_launcher() before visibility
 
+            # Build the default results on first open rather than at startup,
+            # and catch up after a close cleared the query. A no-op when the
+            # list already shows the (empty) query.
+            self._do_search()
+
             # Reveal content with crossfade animation
             self._revealer.set_reveal_child(True)
 
-            rows = self.results_box.rows
+            rows = self._rows
             if rows:
                 self.results_box.select_row(rows[0])
 
-            GLib.timeout_add(300, self._grab_entry_focus)
+            # Reuse the monitor toggle_launcher() picked, rather than
+            # querying the cursor again
+            GLib.timeout_add(300, self._grab_entry_focus, window.monitor)
         else:
-            # Close guard: prevent set_text("") from triggering a new search
-            self._closing = True
-            self.search_entry.set_text("")
-            self._closing = False
+            # A search still waiting on the debounce is moot now
+            if self._debounce_timer is not None:
+                GLib.source_remove(self._debounce_timer)
+                self._debounce_timer = None
+            # Close guard: prevent set_text("") from triggering a new search.
+            # Nothing to clear (and no change signal) if nothing was typed.
+            if self.search_entry.text:
+                self._closing = True
+                self.search_entry.set_text("")
+                self._closing = False
+                # The list still shows the old query; the next show swaps in
+                # the cached defaults instead of filling a hidden list now
+                self._last_query = None
             # Reset revealer for next open (window is already hidden)
             self._revealer.set_reveal_child(False)
 
-    def _grab_entry_focus(self):
+    def _grab_entry_focus(self, monitor_idx):
         """
         Move cursor to search entry to ensure focus.
 
         Uses HyprlandService IPC instead of subprocess calls.
+
+        Args:
+            monitor_idx: Ignis monitor index the panel was shown on
         """
         try:
-            from ignis.services.hyprland import HyprlandService
-            from gi.repository import Gdk as _Gdk
-
-            hyprland = HyprlandService.get_default()
-            ignis_monitor_idx = get_monitor_under_cursor()
-            display = _Gdk.Display.get_default()
-            if display:
-                gtk_monitors = display.get_monitors()
-                if ignis_monitor_idx < gtk_monitors.get_n_items():
-                    connector = gtk_monitors.get_item(ignis_monitor_idx).get_connector()
-                    monitor = hyprland.get_monitor_by_name(connector)
-                    if monitor:
-                        entry_x = monitor.x + (monitor.width // 2)
-                        entry_y = monitor.y + 100
-
-                        hyprland.send_command(
-                            f"dispatch movecursor {entry_x} {entry_y}"
-                        )
+            point = self._entry_focus_point(monitor_idx)
+            if point:
+                self.hyprland.send_command(f"dispatch movecursor {point[0]} {point[1]}")
 
             self.search_entry.grab_focus()
         except Exception:
@@ -324,27 +494,61 @@ class SearchPanel:
 
         return False
 
+    def _entry_focus_point(self, monitor_idx):
+        """
+        Cursor position over the search entry on a monitor, cached.
+
+        The cache is dropped when GTK's monitor list or Hyprland's monitors
+        change, so opening only costs the movecursor command.
+        """
+        if self._focus_points is None:
+            display = Gdk.Display.get_default()
+            if not display:
+                return None
+            display.get_monitors().connect("items-changed", self._on_monitors_changed)
+            self.hyprland.connect("notify::monitors", self._on_monitors_changed)
+            self._focus_points = {}
+
+        if monitor_idx not in self._focus_points:
+            point = None
+            gtk_monitors = Gdk.Display.get_default().get_monitors()
+            if monitor_idx < gtk_monitors.get_n_items():
+                connector = gtk_monitors.get_item(monitor_idx).get_connector()
+                monitor = self.hyprland.get_monitor_by_name(connector)
+                if monitor:
+                    point = (monitor.x + (monitor.width // 2), monitor.y + 100)
+            self._focus_points[monitor_idx] = point
+
+        return self._focus_points[monitor_idx]
+
+    def _on_monitors_changed(self, *_args):
+        """Monitor layout changed — recompute focus points on next open."""
+        if self._focus_points is not None:
+            self._focus_points.clear()
+
     def _on_entry_activate(self):
         """Handle Enter key press — activate selected result."""
+        # Typed and hit Enter within the debounce: search now, so Enter
+        # acts on the results for what is in the entry
+        if self._debounce_timer is not None:
+            GLib.source_remove(self._debounce_timer)
+            self._do_search()
+
         selected = self.results_box.get_selected_row()
         if selected:
             self.results_box.activate_row(selected)
 
     def _on_key_press(self, controller, keyval, keycode, state):
         """Handle keyboard events in CAPTURE phase."""
-        from utils.helpers import close_launcher
-
         if keyval == Gdk.KEY_Escape:
             close_launcher()
             return True
 
         if keyval in (Gdk.KEY_Return, Gdk.KEY_KP_Enter):
-            selected = self.results_box.get_selected_row()
-            if selected:
-                self.results_box.activate_row(selected)
+            self._on_entry_activate()
             return True
 
-        rows = self.results_box.rows
+        rows = self._rows
         if not rows:
             return False
 
@@ -368,9 +572,19 @@ class SearchPanel:
         return False
 
     def _ensure_visible(self):
-        """Scroll to make selected row visible by briefly grabbing focus."""
+        """Scroll the results so the selected row is fully visible."""
         selected = self.results_box.get_selected_row()
-        if selected:
-            selected.grab_focus()
-            if self.search_entry:
-                self.search_entry.grab_focus()
+        if not selected:
+            return
+        ok, bounds = selected.compute_bounds(self.results_box)
+        if not ok:
+            return
+
+        # Move the adjustment directly; focus stays on the search entry
+        adjustment = self._results_scroll.get_vadjustment()
+        top = bounds.origin.y
+        bottom = top + bounds.size.height
+        if top < adjustment.get_value():
+            adjustment.set_value(top)
+        elif bottom > adjustment.get_value() + adjustment.get_page_size():
+            adjustment.set_value(bottom - adjustment.get_page_size())
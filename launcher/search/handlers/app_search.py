@@ -2,11 +2,14 @@
 App Search Handler - Application search with optional fuzzy matching.
 
 When rapidfuzz is available, uses fuzzy matching for typo-tolerant search.
-Falls back to Ignis ApplicationsService.search() otherwise.
+Falls back to Ignis ApplicationsService.search() otherwise. An empty query
+lists the most frecent apps first when a frecency service is given.
 
 Install fuzzy search: pipx inject ignis rapidfuzz
 """
 
+from itertools import islice
+
 from ignis.services.applications import ApplicationsService
 from search.router import ResultItem
 
@@ -23,19 +26,52 @@ class AppSearchHandler:
     name = "app_search"
     priority = 1000
 
-    def __init__(self, max_results: int = 30, fuzzy_threshold: int = 50):
+    DEFAULT_COUNT = 20
+
+    def __init__(self, max_results: int = 30, fuzzy_threshold: int = 50, frecency=None):
         self.apps_service = ApplicationsService.get_default()
         self.max_results = max_results
         self.fuzzy_threshold = fuzzy_threshold
+        self.frecency = frecency
+
+        # Installed apps, snapshotted until ApplicationsService reports a change
+        self._apps: tuple | None = None
+        # (apps, id → name choices, id → app) for the last app list indexed
+        self._index: tuple | None = None
+        # Apps listed for an empty query, frecency-ordered
+        self._defaults: tuple | None = None
+        # app id → ResultItem, filled as apps first appear in results
+        self._results: dict | None = None
+
+        self.apps_service.connect("notify::apps", self._on_apps_changed)
+        if frecency is not None:
+            frecency.connect("changed", self._on_frecency_changed)
+
+    def _on_apps_changed(self, *_args):
+        """Installed apps changed — re-snapshot on the next search."""
+        self._apps = None
+        self._index = None
+        self._defaults = None
+        self._results = None
+
+    def _on_frecency_changed(self, *_args):
+        """Launch counts changed — re-rank the empty-query defaults."""
+        self._defaults = None
+
+    def _installed_apps(self) -> tuple:
+        """Snapshot of the installed apps, read from the service once."""
+        if self._apps is None:
+            self._apps = tuple(self.apps_service.apps)
+        return self._apps
 
     def matches(self, query: str) -> bool:
         return True
 
     def get_results(self, query: str) -> list[ResultItem]:
-        all_apps = self.apps_service.apps
+        all_apps = self._installed_apps()
 
         if not query or not query.strip():
-            return self._apps_to_results(all_apps[:20])
+            return self._apps_to_results(self._default_apps(all_apps))
 
         if HAS_RAPIDFUZZ:
             return self._fuzzy_search(query, all_apps)
@@ -45,11 +81,12 @@ class AppSearchHandler:
 
     def _fuzzy_search(self, query: str, all_apps) -> list[ResultItem]:
         """Fuzzy search using rapidfuzz weighted ratio against app names."""
-        # Match against name only — descriptions dilute relevance
-        choices = {app.id: app.name for app in all_apps}
+        choices, by_id = self._app_index(all_apps)
 
+        # Choices are case-folded once per app snapshot; fold the query to
+        # match so only case stops mattering (punctuation still counts)
         matches = process.extract(
-            query,
+            query.casefold(),
             choices,
             scorer=fuzz.WRatio,
             limit=self.max_results,
@@ -57,36 +94,73 @@ class AppSearchHandler:
         )
 
         # matches: list of (matched_string, score, key)
+        return self._apps_to_results(
+            by_id[app_id] for _matched_str, _score, app_id in matches
+        )
+
+    def _default_apps(self, all_apps) -> tuple:
+        """
+        Apps for an empty query: most frecent first, then in service order.
+
+        Computed once and reused until the apps or launch stats change.
+        """
+        if self._defaults is not None:
+            return self._defaults
+        if self.frecency is None:
+            return tuple(all_apps[:self.DEFAULT_COUNT])
+
+        _choices, by_id = self._app_index(all_apps)
+        ranked = [
+            app for app, _score, _count in self.frecency.get_top_apps_resolved(
+                limit=self.DEFAULT_COUNT, min_launches=1, resolver=by_id.get,
+            )
+        ]
+        ranked_ids = {app.id for app in ranked}
+        rest = (app for app in all_apps if app.id not in ranked_ids)
+        ranked.extend(islice(rest, self.DEFAULT_COUNT - len(ranked)))
+
+        self._defaults = tuple(ranked)
+        return self._defaults
+
+    def _app_index(self, all_apps):
+        """
+        Name choices and id lookup for all_apps, reused while it is unchanged.
+
+        Returns:
+            Tuple of (id → name dict to match against, id → app dict)
+        """
+        if self._index is not None and self._index[0] is all_apps:
+            return self._index[1], self._index[2]
+        # Match against name only — descriptions dilute relevance
+        if HAS_RAPIDFUZZ:
+            choices = {app.id: app.name.casefold() for app in all_apps}
+        else:
+            choices = {app.id: app.name for app in all_apps}
+        by_id = {app.id: app for app in all_apps}
+        self._index = (all_apps, choices, by_id)
+        return choices, by_id
+
+    def _apps_to_results(self, apps) -> list[ResultItem]:
+        """
+        Convert Application objects to ResultItem list.
+
+        Each app's ResultItem is built once per app snapshot and reused, so
+        its name, description and icon are read from the app only once.
+        """
+        if self._results is None:
+            self._results = {}
+        cache = self._results
+
         results = []
-        for _matched_str, _score, app_id in matches:
-            app = self._find_app(app_id, all_apps)
-            if app:
-                results.append(ResultItem(
+        for app in apps:
+            item = cache.get(app.id)
+            if item is None or item.app is not app:
+                item = cache[app.id] = ResultItem(
                     title=app.name,
                     description=app.description or "",
                     icon=app.icon,
                     result_type="app",
                     app=app,
-                ))
-
+                )
+            results.append(item)
         return results
-
-    def _find_app(self, app_id: str, all_apps):
-        """Find app in list by ID."""
-        for app in all_apps:
-            if app.id == app_id:
-                return app
-        return None
-
-    def _apps_to_results(self, apps) -> list[ResultItem]:
-        """Convert Application objects to ResultItem list."""
-        return [
-            ResultItem(
-                title=app.name,
-                description=app.description or "",
-                icon=app.icon,
-                result_type="app",
-                app=app,
-            )
-            for app in apps
-        ]
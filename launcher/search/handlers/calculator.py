@@ -7,10 +7,10 @@ Triggers on "=" prefix. Uses simpleeval for safe expression evaluation
 Install: pipx inject ignis simpleeval
 """
 
+import logging
 import math
 import subprocess
 
-from loguru import logger
 from search.router import ResultItem
 
 try:
@@ -19,12 +19,15 @@ try:
 except ImportError:
     HAS_SIMPLEEVAL = False
 
+logger = logging.getLogger(f"ignomi.{__name__}")
+
 
 class CalculatorHandler:
     """Evaluate math expressions prefixed with '='."""
 
     name = "calculator"
     priority = 100
+    trigger_chars = frozenset("=")
 
     def matches(self, query: str) -> bool:
         if not HAS_SIMPLEEVAL:
@@ -92,7 +95,7 @@ class CalculatorHandler:
                 result_type="calculator",
             )]
         except Exception as e:
-            logger.warning(f"Unexpected calculator error for '{expr}': {e}")
+            logger.warning("Unexpected calculator error for '%s': %s", expr, e)
             return [ResultItem(
                 title="Error",
                 description=str(e)[:80],
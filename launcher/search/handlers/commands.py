@@ -18,19 +18,22 @@ Example commands.toml:
 Usage: !lock, !suspend, etc.
 """
 
+import logging
 import subprocess
 from pathlib import Path
 
 import toml
-from loguru import logger
 from search.router import ResultItem
 
+logger = logging.getLogger(f"ignomi.{__name__}")
+
 
 class CustomCommandsHandler:
     """Execute user-defined commands via '!' prefix."""
 
     name = "commands"
     priority = 300
+    trigger_chars = frozenset("!")
 
     def __init__(self):
         self.commands = self._load_commands()
@@ -86,7 +89,7 @@ class CustomCommandsHandler:
                     stderr=subprocess.DEVNULL,
                 )
             except Exception:
-                logger.exception(f"Failed to execute command: {exec_str}")
+                logger.exception("Failed to execute command: %s", exec_str)
 
         from utils.helpers import close_launcher
         close_launcher()
@@ -103,9 +106,9 @@ class CustomCommandsHandler:
             # Validate entries
             for name, cmd in list(commands.items()):
                 if not isinstance(cmd, dict) or "exec" not in cmd:
-                    logger.warning(f"Skipping malformed command '{name}': missing 'exec' field")
+                    logger.warning("Skipping malformed command '%s': missing 'exec' field", name)
                     del commands[name]
             return commands
         except Exception:
-            logger.exception(f"Failed to load commands from {commands_path}")
+            logger.exception("Failed to load commands from %s", commands_path)
             return {}
@@ -34,6 +34,9 @@ class SystemControlsHandler:
 
     name = "controls"
     priority = 50  # Highest priority — check before everything
+    trigger_chars = frozenset(
+        keyword[0] for keyword in VOLUME_KEYWORDS | BRIGHTNESS_KEYWORDS | MUTE_KEYWORDS
+    )
 
     def _audio_available(self) -> bool:
         """Check if audio control is actually usable."""
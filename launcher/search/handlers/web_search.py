@@ -11,12 +11,14 @@ Triggers on prefix patterns:
 Search engines are configurable via settings.toml [web_search] section.
 """
 
+import logging
 import subprocess
 import urllib.parse
 
-from loguru import logger
 from search.router import ResultItem
 
+logger = logging.getLogger(f"ignomi.{__name__}")
+
 # Default search engine URLs (can be overridden in settings.toml)
 DEFAULT_ENGINES = {
     "?": {"name": "Kagi", "url": "https://kagi.com/search?q={query}", "icon": "web-browser"},
@@ -35,6 +37,7 @@ class WebSearchHandler:
 
     def __init__(self, engines: dict = None):
         self.engines = engines or DEFAULT_ENGINES
+        self.trigger_chars = frozenset(prefix[0].lower() for prefix in self.engines if prefix)
 
     def matches(self, query: str) -> bool:
         q = query.strip()
@@ -4,6 +4,10 @@ Query Router - Dispatches search queries to priority-ordered handlers.
 Each handler declares a priority (lower = higher priority) and a matches()
 method. The router finds the first matching handler and returns its results.
 App search is always the fallback (highest priority number).
+
+Handlers that only match queries starting with certain characters may also
+declare ``trigger_chars`` (lowercase). The router then skips them for any
+other first character without calling matches().
 """
 
 from collections.abc import Callable
@@ -24,7 +28,12 @@ class ResultItem:
 
 
 class SearchHandler(Protocol):
-    """Structural type for search handlers. No inheritance required."""
+    """
+    Structural type for search handlers. No inheritance required.
+
+    Optional: ``trigger_chars`` — a set of lowercase characters that every
+    matching query (stripped) starts with.
+    """
     name: str
     priority: int
 
@@ -37,11 +46,31 @@ class QueryRouter:
 
     def __init__(self):
         self._handlers: list[SearchHandler] = []
+        # Handlers to try per first query character, and for any other one
+        self._by_char: dict[str, list[SearchHandler]] = {}
+        self._untriggered: list[SearchHandler] = []
 
     def register(self, handler: SearchHandler) -> None:
         """Register a handler and re-sort by priority."""
         self._handlers.append(handler)
         self._handlers.sort(key=lambda h: h.priority)
+        self._build_dispatch()
+
+    def _build_dispatch(self) -> None:
+        """Precompute the handler list for each trigger character."""
+        self._untriggered = [
+            h for h in self._handlers if getattr(h, "trigger_chars", None) is None
+        ]
+        chars = set()
+        for h in self._handlers:
+            chars.update(getattr(h, "trigger_chars", None) or ())
+        self._by_char = {
+            char: [
+                h for h in self._handlers
+                if getattr(h, "trigger_chars", None) is None or char in h.trigger_chars
+            ]
+            for char in chars
+        }
 
     def route(self, query: str) -> tuple[str, list[ResultItem]]:
         """
@@ -61,7 +90,8 @@ class QueryRouter:
                     return handler.name, handler.get_results("")
             return "none", []
 
-        for handler in self._handlers:
+        first = query.strip()[:1].lower()
+        for handler in self._by_char.get(first, self._untriggered):
             if handler.matches(query):
                 return handler.name, handler.get_results(query)
 
@@ -14,13 +14,17 @@ Where recency_weight depends on how recently the app was launched:
 This ensures recently-used apps rank higher than frequently-but-old apps.
 """
 
+import logging
 import sqlite3
 import time
+from collections.abc import Callable
 from pathlib import Path
+from typing import Any
 
 from gi.repository import GObject
 from ignis.base_service import BaseService
-from loguru import logger
+
+logger = logging.getLogger(f"ignomi.{__name__}")
 
 
 class FrecencyService(BaseService):
@@ -33,6 +37,7 @@ class FrecencyService(BaseService):
     Methods:
         record_launch(app_id): Record an app launch
         get_top_apps(limit): Get top N apps by frecency score
+        get_top_apps_resolved(limit, min_launches, resolver): Top N as resolved app objects
     """
 
     __gtype_name__ = "FrecencyService"
@@ -53,7 +58,7 @@ class FrecencyService(BaseService):
         self._conn = sqlite3.connect(str(self.db_path))
         self._conn.execute("PRAGMA journal_mode=WAL")
         self._init_database()
-        logger.debug(f"FrecencyService initialized with db at {self.db_path}")
+        logger.debug("FrecencyService initialized with db at %s", self.db_path)
 
     def _init_database(self):
         """Create database schema if it doesn't exist."""
@@ -103,9 +108,9 @@ class FrecencyService(BaseService):
 
             self._conn.commit()
 
-            logger.debug(f"Recorded launch for {app_id}")
+            logger.debug("Recorded launch for %s", app_id)
         except sqlite3.Error:
-            logger.exception(f"Failed to record launch for {app_id}")
+            logger.exception("Failed to record launch for %s", app_id)
             return
 
         # Notify listeners (frequent panel will refresh)
@@ -123,6 +128,38 @@ class FrecencyService(BaseService):
             List of tuples: (app_id, frecency_score, launch_count, last_launch)
             Sorted by frecency_score descending
         """
+        return self._ranked_apps(min_launches)[:limit]
+
+    def get_top_apps_resolved(
+        self, limit: int, min_launches: int, resolver: Callable[[str], Any],
+    ) -> list[tuple[Any, float, int]]:
+        """
+        Get top applications ranked by frecency, mapped through a resolver.
+
+        IDs the resolver can't map (uninstalled apps) are skipped without
+        counting toward the limit, so callers always get up to `limit`
+        usable entries.
+
+        Args:
+            limit: Maximum number of apps to return
+            min_launches: Minimum launch count to include app
+            resolver: Maps an app ID to an app object, or None if unknown
+
+        Returns:
+            List of tuples: (app, frecency_score, launch_count)
+            Sorted by frecency_score descending
+        """
+        resolved = []
+        for app_id, score, launch_count, _last_launch in self._ranked_apps(min_launches):
+            app = resolver(app_id)
+            if app is not None:
+                resolved.append((app, score, launch_count))
+                if len(resolved) >= limit:
+                    break
+        return resolved
+
+    def _ranked_apps(self, min_launches: int) -> list[tuple[str, float, int, int]]:
+        """All apps meeting min_launches, sorted by frecency score descending."""
         cursor = self._conn.cursor()
 
         # Get all apps meeting minimum launch requirement
@@ -142,8 +179,7 @@ class FrecencyService(BaseService):
         # Sort by frecency score (descending)
         results.sort(key=lambda x: x[1], reverse=True)
 
-        # Return top N
-        return results[:limit]
+        return results
 
     def get_app_stats(self, app_id: str) -> tuple[int, int, int] | None:
         """
@@ -235,7 +271,7 @@ class FrecencyService(BaseService):
 
             self._conn.commit()
         except sqlite3.Error:
-            logger.exception(f"Failed to clear stats for {app_id or 'all apps'}")
+            logger.exception("Failed to clear stats for %s", app_id or "all apps")
             return
 
         self.emit("changed")
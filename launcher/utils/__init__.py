@@ -8,15 +8,19 @@ from .helpers import (
     add_bookmark_with_refresh,
     clear_container,
     close_launcher,
+    create_icon,
     find_app_by_id,
+    get_icon_paintable,
     get_monitor_under_cursor,
     hyprland_monitor_to_ignis_monitor,
     is_bookmarked,
     launch_app,
     load_bookmarks,
     load_settings,
+    low_fx_enabled,
     remove_bookmark,
     save_bookmarks,
+    save_bookmarks_async,
     update_window_monitor,
 )
 
@@ -24,8 +28,10 @@ __all__ = [
     "launch_app",
     "close_launcher",
     "load_settings",
+    "low_fx_enabled",
     "load_bookmarks",
     "save_bookmarks",
+    "save_bookmarks_async",
     "add_bookmark",
     "remove_bookmark",
     "is_bookmarked",
@@ -33,6 +39,8 @@ __all__ = [
     "hyprland_monitor_to_ignis_monitor",
     "clear_container",
     "find_app_by_id",
+    "get_icon_paintable",
+    "create_icon",
     "add_bookmark_with_refresh",
     "update_window_monitor",
 ]
@@ -10,6 +10,9 @@ Provides common functions used across multiple panels:
 """
 
 import json
+import logging
+import os
+import time
 from pathlib import Path
 from typing import Any
 
@@ -17,7 +20,8 @@ import toml
 from gi.repository import Gdk, GLib
 from ignis.services.applications import ApplicationsService
 from ignis.services.hyprland import HyprlandService
-from loguru import logger
+
+logger = logging.getLogger(f"ignomi.{__name__}")
 
 
 def _hyprland_name_to_ignis_index(connector_name: str) -> int:
@@ -62,19 +66,39 @@ def hyprland_monitor_to_ignis_monitor(hyprland_id: int) -> int:
                 return _hyprland_name_to_ignis_index(monitor.name)
         return 0
     except Exception:
-        logger.debug(f"Failed to convert Hyprland monitor {hyprland_id}")
+        logger.debug("Failed to convert Hyprland monitor %s", hyprland_id)
         return 0
 
 
+# (monotonic time, monitor) of the last cursor lookup
+_cursor_monitor_cache = (float("-inf"), 0)
+_CURSOR_MONITOR_TTL = 0.1
+
+
 def get_monitor_under_cursor() -> int:
     """
     Get the ID of the monitor where the cursor is currently located.
 
-    Uses HyprlandService IPC for monitor data and cursor position.
+    Uses HyprlandService IPC for monitor data and cursor position. The
+    result is reused for 100ms so the burst of lookups at startup and on
+    open (one per panel) costs a single IPC round trip.
 
     Returns:
         Monitor ID (int), defaults to 0 if detection fails
     """
+    global _cursor_monitor_cache
+    now = time.monotonic()
+    checked_at, monitor = _cursor_monitor_cache
+    if now - checked_at < _CURSOR_MONITOR_TTL:
+        return monitor
+
+    monitor = _query_monitor_under_cursor()
+    _cursor_monitor_cache = (now, monitor)
+    return monitor
+
+
+def _query_monitor_under_cursor() -> int:
+    """Ask Hyprland which monitor holds the cursor (uncached)."""
     try:
         hyprland = HyprlandService.get_default()
 
@@ -114,21 +138,105 @@ def clear_container(container) -> None:
         child = next_child
 
 
+# -- Icon cache --
+_icon_cache: dict[tuple[str, int], Any] = {}
+_icon_theme_watched = False
+
+
+def get_icon_paintable(icon_name: str, size: int):
+    """
+    Resolve a themed icon to a paintable, cached per (name, size).
+
+    Rows are rebuilt on every refresh; sharing the paintable means the icon
+    theme is searched and the image decoded once per app per session. The
+    cache is cleared when the icon theme changes.
+
+    Args:
+        icon_name: Themed icon name (file paths are not cached)
+        size: Pixel size to resolve at
+
+    Returns:
+        Gtk.IconPaintable, or None if the name is a path or not in the theme
+    """
+    global _icon_theme_watched
+    if not icon_name or icon_name.startswith("/"):
+        return None
+
+    key = (icon_name, size)
+    paintable = _icon_cache.get(key)
+    if paintable is not None:
+        return paintable
+
+    from gi.repository import Gtk
+
+    display = Gdk.Display.get_default()
+    if not display:
+        return None
+    theme = Gtk.IconTheme.get_for_display(display)
+    if not _icon_theme_watched:
+        theme.connect("changed", lambda *_: _icon_cache.clear())
+        _icon_theme_watched = True
+    if not theme.has_icon(icon_name):
+        return None
+
+    paintable = theme.lookup_icon(icon_name, None, size, 1, Gtk.TextDirection.NONE, 0)
+    _icon_cache[key] = paintable
+    return paintable
+
+
+def create_icon(icon_name: str, size: int):
+    """
+    Create an app icon widget, reusing a cached paintable when themed.
+
+    Args:
+        icon_name: Themed icon name or image path
+        size: Pixel size of the icon
+
+    Returns:
+        widgets.Icon with the "app-icon" style class
+    """
+    from ignis import widgets
+
+    paintable = get_icon_paintable(icon_name, size)
+    if paintable is None:
+        return widgets.Icon(image=icon_name, pixel_size=size, css_classes=["app-icon"])
+    icon = widgets.Icon(pixel_size=size, css_classes=["app-icon"])
+    icon.set_from_paintable(paintable)
+    return icon
+
+
+# -- Application index --
+_app_index = None
+_app_index_watched = False
+
+
+def _invalidate_app_index(*_args) -> None:
+    """Drop the app index so the next lookup rebuilds it."""
+    global _app_index
+    _app_index = None
+
+
 def find_app_by_id(app_id: str):
     """
     Find an Application object by its desktop file ID.
 
+    Lookups go through an id → app dict built on first use and dropped
+    whenever ApplicationsService reports a change to its app list.
+
     Args:
         app_id: Desktop file ID (e.g., "firefox.desktop")
 
     Returns:
         Application object, or None if not found
     """
-    apps_service = ApplicationsService.get_default()
-    for app in apps_service.apps:
-        if app.id == app_id:
-            return app
-    return None
+    global _app_index, _app_index_watched
+    if _app_index is None:
+        apps_service = ApplicationsService.get_default()
+        if not _app_index_watched:
+            apps_service.connect("notify::apps", _invalidate_app_index)
+            _app_index_watched = True
+        _app_index = {app.id: app for app in apps_service.apps}
+    return _app_index.get(app_id)
 
 
 def add_bookmark_with_refresh(app_id: str, button=None) -> None:
@@ -139,22 +247,34 @@ def add_bookmark_with_refresh(app_id: str, button=None) -> None:
         app_id: Desktop file ID to bookmark
         button: Optional button widget for CSS pulse feedback
     """
+    from ignis.app import IgnisApp
+    app_instance = IgnisApp.get_default()
+    bookmarks_window = app_instance.get_window("ignomi-bookmarks")
+    bookmarks_panel = getattr(bookmarks_window, "panel", None)
+
+    # Land any debounced reorder first so add_bookmark() sees current order
+    if bookmarks_panel:
+        bookmarks_panel.flush_save()
+
     if is_bookmarked(app_id):
         return
 
     add_bookmark(app_id)
 
-    # Visual feedback on the triggering button
+    # Visual feedback on the triggering button. The pulse itself is a CSS
+    # animation; the timer only drops the class so it can replay, which is
+    # not urgent — keep it below rendering and input priority.
     if button:
         button.add_css_class("bookmark-added")
-        GLib.timeout_add(300, lambda: button.remove_css_class("bookmark-added"))
+        GLib.timeout_add(
+            300,
+            lambda: button.remove_css_class("bookmark-added"),
+            priority=GLib.PRIORITY_LOW,
+        )
 
     # Refresh bookmarks panel
-    from ignis.app import IgnisApp
-    app_instance = IgnisApp.get_default()
-    bookmarks_window = app_instance.get_window("ignomi-bookmarks")
-    if bookmarks_window and hasattr(bookmarks_window, 'panel'):
-        bookmarks_window.panel.refresh_from_disk()
+    if bookmarks_panel:
+        bookmarks_panel.refresh_from_disk()
 
 
 def update_window_monitor(window) -> None:
@@ -164,9 +284,14 @@ def update_window_monitor(window) -> None:
     Call this in visibility-changed handlers to ensure panels
     appear on the correct monitor.
 
+    Does nothing on the hide notification, so the cursor isn't queried
+    while the panel is closing.
+
     Args:
         window: An Ignis Window widget
     """
+    if not window.get_visible():
+        return
     cursor_monitor = get_monitor_under_cursor()
     if window.monitor != cursor_monitor:
         window.monitor = cursor_monitor
@@ -190,7 +315,6 @@ def toggle_launcher():
     from ignis.app import IgnisApp
 
     app = IgnisApp.get_default()
-    target_monitor = get_monitor_under_cursor()
 
     # Collect all ignomi windows
     ignomi_windows = [
@@ -208,9 +332,13 @@ def toggle_launcher():
         # Closing — use close_launcher() for proper animation sequencing
         close_launcher()
     else:
-        # Opening — set monitors BEFORE showing (Layer Shell requirement)
+        # Opening — set monitors BEFORE showing (Layer Shell requirement).
+        # The cursor is only queried here; closing doesn't need a monitor.
+        # Only reassign when it changed: each set re-targets the surface.
+        target_monitor = get_monitor_under_cursor()
         for w in ignomi_windows:
-            w.monitor = target_monitor
+            if w.monitor != target_monitor:
+                w.monitor = target_monitor
 
         for w in ignomi_windows:
             w.set_visible(True)
@@ -227,7 +355,7 @@ def launch_app(app, frecency_service, close_delay_ms: int = 300):
     """
     # Launch the application
     app.launch()
-    logger.debug(f"Launched {app.id}")
+    logger.debug("Launched %s", app.id)
 
     # Record in frecency for usage tracking
     frecency_service.record_launch(app.id)
@@ -338,15 +466,32 @@ def load_settings() -> dict[str, Any]:
             _settings_cache = settings
             return settings
         except Exception as e:
-            logger.warning(f"Could not load settings from {settings_path}: {e}, using defaults")
+            logger.warning("Could not load settings from %s: %s, using defaults", settings_path, e)
             _settings_cache = defaults
             return defaults
     else:
-        logger.info(f"Settings file not found at {settings_path}, using defaults")
+        logger.info("Settings file not found at %s, using defaults", settings_path)
         _settings_cache = defaults
         return defaults
 
 
+def low_fx_enabled() -> bool:
+    """
+    Whether to drop rounded corners, shadows and transitions.
+
+    Uses ``[rendering] lowfx`` from settings when set; otherwise enabled
+    automatically on GTK's software renderer (``GSK_RENDERER=cairo``),
+    where those effects are the most expensive part of drawing a panel.
+
+    Returns:
+        True if the low-effects style should be applied
+    """
+    lowfx = load_settings().get("rendering", {}).get("lowfx")
+    if lowfx is not None:
+        return bool(lowfx)
+    return os.environ.get("GSK_RENDERER", "").lower() == "cairo"
+
+
 def _deep_merge(base: dict, override: dict) -> dict:
     """
     Deep merge two dictionaries.
@@ -385,7 +530,7 @@ def _bookmarks_path() -> Path:
     if old_path.exists():
         xdg_path.parent.mkdir(parents=True, exist_ok=True)
         shutil.copy2(str(old_path), str(xdg_path))
-        logger.info(f"Migrated bookmarks from {old_path} to {xdg_path}")
+        logger.info("Migrated bookmarks from %s to %s", old_path, xdg_path)
         return xdg_path
 
     return xdg_path
@@ -413,13 +558,31 @@ def load_bookmarks() -> list:
                 _bookmarks_cache = data.get("bookmarks", [])
                 return list(_bookmarks_cache)
         except Exception as e:
-            logger.warning(f"Could not load bookmarks from {bookmarks_path_val}: {e}")
+            logger.warning("Could not load bookmarks from %s: %s", bookmarks_path_val, e)
             return []
     else:
-        logger.info(f"Bookmarks file not found at {bookmarks_path_val}, using empty list")
+        logger.info("Bookmarks file not found at %s, using empty list", bookmarks_path_val)
         return []
 
 
+def _write_bookmarks_file(path: Path, bookmark_ids: list) -> bool:
+    """Write bookmark IDs to path atomically (tmp + rename)."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps({"bookmarks": bookmark_ids}, indent=2))
+        os.replace(str(tmp_path), str(path))
+        logger.debug("Saved %d bookmarks", len(bookmark_ids))
+        return True
+    except Exception as e:
+        logger.error("Could not save bookmarks to %s: %s", path, e)
+        return False
+
+
+# Single background writer — one thread keeps queued saves in order
+_bookmarks_writer = None
+
+
 def save_bookmarks(bookmark_ids: list):
     """
     Save bookmark app IDs to JSON file (atomic write via tmp + rename).
@@ -427,21 +590,38 @@ def save_bookmarks(bookmark_ids: list):
     Args:
         bookmark_ids: List of desktop file IDs to save
     """
-    import os
-
     global _bookmarks_cache
 
     path = _bookmarks_path()
-    path.parent.mkdir(parents=True, exist_ok=True)
-
-    try:
-        tmp_path = path.with_suffix(".tmp")
-        tmp_path.write_text(json.dumps({"bookmarks": bookmark_ids}, indent=2))
-        os.replace(str(tmp_path), str(path))
+    if _bookmarks_writer is not None:
+        # Queue behind any background save so an older order can't land last
+        saved = _bookmarks_writer.submit(_write_bookmarks_file, path, list(bookmark_ids)).result()
+    else:
+        saved = _write_bookmarks_file(path, bookmark_ids)
+    if saved:
         _bookmarks_cache = list(bookmark_ids)
-        logger.debug(f"Saved {len(bookmark_ids)} bookmarks")
-    except Exception as e:
-        logger.error(f"Could not save bookmarks to {path}: {e}")
+
+
+def save_bookmarks_async(bookmark_ids: list):
+    """
+    Save bookmark app IDs without blocking the GTK main thread.
+
+    The cache is updated immediately so load_bookmarks() sees the new
+    order; the file is written on a background thread.
+
+    Args:
+        bookmark_ids: List of desktop file IDs to save
+    """
+    global _bookmarks_cache, _bookmarks_writer
+
+    _bookmarks_cache = list(bookmark_ids)
+    if _bookmarks_writer is None:
+        from concurrent.futures import ThreadPoolExecutor
+
+        _bookmarks_writer = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="bookmarks-save",
+        )
+    _bookmarks_writer.submit(_write_bookmarks_file, _bookmarks_path(), list(bookmark_ids))
 
 
 def add_bookmark(app_id: str):
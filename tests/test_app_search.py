@@ -52,6 +52,7 @@ sys.modules["ignis.services.applications"] = _fake_apps
 sys.modules["ignis.services.audio"] = _fake_services.audio
 sys.modules["ignis.services.backlight"] = _fake_services.backlight
 
+from search.handlers import app_search
 from search.handlers.app_search import AppSearchHandler, HAS_RAPIDFUZZ
 from search.router import ResultItem
 
@@ -73,36 +74,37 @@ def _make_app(app_id, name, description=""):
     return app
 
 
+@pytest.fixture
+def make_handler(monkeypatch):
+    """Build an AppSearchHandler over a mock service listing the given apps."""
+    def _make(apps, frecency=None):
+        service = MagicMock()
+        service.apps = apps
+        monkeypatch.setattr(app_search, "ApplicationsService", MagicMock())
+        app_search.ApplicationsService.get_default.return_value = service
+        return AppSearchHandler(max_results=30, fuzzy_threshold=50, frecency=frecency)
+    return _make
+
+
 class TestAppSearchHandler:
     """Test app search handler behavior."""
 
-    def test_always_matches(self):
-        handler = AppSearchHandler.__new__(AppSearchHandler)
-        handler.apps_service = MagicMock()
-        handler.max_results = 30
-        handler.fuzzy_threshold = 50
+    def test_always_matches(self, make_handler):
+        handler = make_handler([])
         assert handler.matches("anything") is True
         assert handler.matches("") is True
 
-    def test_empty_query_returns_default_apps(self):
+    def test_empty_query_returns_default_apps(self, make_handler):
         apps = [_make_app(f"app{i}.desktop", f"App {i}") for i in range(25)]
-        handler = AppSearchHandler.__new__(AppSearchHandler)
-        handler.apps_service = MagicMock()
-        handler.apps_service.apps = apps
-        handler.max_results = 30
-        handler.fuzzy_threshold = 50
+        handler = make_handler(apps)
 
         results = handler.get_results("")
         # Should return up to 20 (the default slice)
         assert len(results) == 20
 
-    def test_results_are_result_items(self):
+    def test_results_are_result_items(self, make_handler):
         apps = [_make_app("firefox.desktop", "Firefox", "Web Browser")]
-        handler = AppSearchHandler.__new__(AppSearchHandler)
-        handler.apps_service = MagicMock()
-        handler.apps_service.apps = apps
-        handler.max_results = 30
-        handler.fuzzy_threshold = 50
+        handler = make_handler(apps)
 
         results = handler.get_results("")
         assert len(results) == 1
@@ -112,18 +114,108 @@ class TestAppSearchHandler:
         assert results[0].app is apps[0]
 
     @pytest.mark.skipif(not HAS_RAPIDFUZZ, reason="rapidfuzz not installed")
-    def test_fuzzy_search_finds_close_match(self):
+    def test_fuzzy_search_finds_close_match(self, make_handler):
         apps = [
             _make_app("firefox.desktop", "Firefox", "Web Browser"),
             _make_app("code.desktop", "Visual Studio Code", "Code Editor"),
             _make_app("nautilus.desktop", "Files", "File Manager"),
         ]
-        handler = AppSearchHandler.__new__(AppSearchHandler)
-        handler.apps_service = MagicMock()
-        handler.apps_service.apps = apps
-        handler.max_results = 30
-        handler.fuzzy_threshold = 50
+        handler = make_handler(apps)
 
         results = handler._fuzzy_search("firefx", apps)  # Typo
         assert len(results) >= 1
         assert results[0].title == "Firefox"
+
+
+class TestAppSnapshot:
+    """Test the installed-app snapshot and its invalidation."""
+
+    def test_apps_read_once_until_changed(self, make_handler):
+        handler = make_handler([_make_app("firefox.desktop", "Firefox")])
+        handler.get_results("")
+        handler.apps_service.apps = [_make_app("code.desktop", "Code")]
+        assert handler.get_results("")[0].title == "Firefox"
+
+        handler._on_apps_changed()
+        assert handler.get_results("")[0].title == "Code"
+
+    def test_result_items_reused_across_searches(self, make_handler):
+        handler = make_handler([_make_app("firefox.desktop", "Firefox")])
+        first = handler.get_results("")[0]
+        assert handler.get_results("")[0] is first
+
+        handler._on_apps_changed()
+        assert handler.get_results("")[0] is not first
+
+    @pytest.mark.skipif(not HAS_RAPIDFUZZ, reason="rapidfuzz not installed")
+    def test_fuzzy_index_follows_app_changes(self, make_handler):
+        handler = make_handler([_make_app("firefox.desktop", "Firefox")])
+        assert handler.get_results("firefox")[0].title == "Firefox"
+
+        handler.apps_service.apps = [_make_app("code.desktop", "Visual Studio Code")]
+        handler._on_apps_changed()
+        results = handler.get_results("firefox")
+        assert all(r.title != "Firefox" for r in results)
+
+
+class _StubFrecency:
+    """Frecency stand-in returning a fixed ranking of app IDs."""
+
+    def __init__(self, ranked_ids):
+        self.ranked_ids = ranked_ids
+
+    def connect(self, signal, callback):
+        self.on_changed = callback
+
+    def get_top_apps_resolved(self, limit, min_launches, resolver):
+        resolved = [(resolver(app_id), 1.0, 1) for app_id in self.ranked_ids]
+        return [entry for entry in resolved if entry[0] is not None][:limit]
+
+
+class TestDefaultApps:
+    """Test the empty-query default listing."""
+
+    def test_frecent_apps_listed_first(self, make_handler):
+        apps = [_make_app(f"app{i}.desktop", f"App {i}") for i in range(25)]
+        handler = make_handler(
+            apps, _StubFrecency(["app7.desktop", "gone.desktop", "app3.desktop"])
+        )
+
+        titles = [r.title for r in handler.get_results("")]
+        assert titles[:3] == ["App 7", "App 3", "App 0"]
+        assert len(titles) == 20
+        assert len(set(titles)) == 20
+
+    def test_defaults_reranked_after_frecency_change(self, make_handler):
+        apps = [_make_app(f"app{i}.desktop", f"App {i}") for i in range(5)]
+        handler = make_handler(apps, _StubFrecency(["app2.desktop"]))
+        assert handler.get_results("")[0].title == "App 2"
+
+        handler.frecency.ranked_ids = ["app4.desktop"]
+        assert handler.get_results("")[0].title == "App 2"  # Cached
+        handler.frecency.on_changed()
+        assert handler.get_results("")[0].title == "App 4"
+
+
+@pytest.mark.skipif(not HAS_RAPIDFUZZ, reason="rapidfuzz not installed")
+class TestFuzzyCaseFolding:
+    """Test that fuzzy matching ignores case, and only case."""
+
+    def test_query_case_does_not_change_ranking(self, make_handler):
+        handler = make_handler([
+            _make_app("firefox.desktop", "Firefox"),
+            _make_app("files.desktop", "Files"),
+        ])
+
+        lower = [r.title for r in handler.get_results("firefox")]
+        upper = [r.title for r in handler.get_results("FIREFOX")]
+        assert lower[0] == "Firefox"
+        assert lower == upper
+
+    def test_punctuated_query_ranks_punctuated_app_first(self, make_handler):
+        handler = make_handler([
+            _make_app("gcc.desktop", "GCC"),
+            _make_app("gpp.desktop", "G++"),
+        ])
+
+        assert handler.get_results("g++")[0].title == "G++"
@@ -48,7 +48,7 @@ sys.modules["ignis.services"] = _fake_services
 sys.modules["ignis.services.applications"] = _fake_apps
 sys.modules["ignis.services.hyprland"] = _fake_hyprland
 
-from utils.helpers import _deep_merge, load_bookmarks, save_bookmarks
+from utils.helpers import _deep_merge, load_bookmarks, save_bookmarks, save_bookmarks_async
 
 # Restore modules
 for _mod in _modules_to_fake:
@@ -140,6 +140,37 @@ class TestSaveBookmarks:
         assert result == ["cached.desktop"]
 
 
+class TestSaveBookmarksAsync:
+    """Test background bookmark saves."""
+
+    def _drain(self):
+        import utils.helpers as h
+        h._bookmarks_writer.submit(lambda: None).result()
+
+    def test_cache_updated_immediately(self, tmp_path):
+        path = tmp_path / "bookmarks.json"
+        with patch("utils.helpers._bookmarks_path", return_value=path):
+            save_bookmarks_async(["async.desktop"])
+            assert load_bookmarks() == ["async.desktop"]
+        self._drain()
+
+    def test_writes_file(self, tmp_path):
+        path = tmp_path / "bookmarks.json"
+        with patch("utils.helpers._bookmarks_path", return_value=path):
+            save_bookmarks_async(["a.desktop", "b.desktop"])
+        self._drain()
+        assert json.loads(path.read_text())["bookmarks"] == ["a.desktop", "b.desktop"]
+
+    def test_last_save_wins(self, tmp_path):
+        path = tmp_path / "bookmarks.json"
+        with patch("utils.helpers._bookmarks_path", return_value=path):
+            save_bookmarks_async(["first.desktop"])
+            save_bookmarks_async(["second.desktop"])
+            save_bookmarks(["third.desktop"])
+        self._drain()
+        assert json.loads(path.read_text())["bookmarks"] == ["third.desktop"]
+
+
 class TestBookmarksCaching:
     """Test that bookmark cache works correctly."""
 
@@ -150,3 +181,41 @@ class TestBookmarksCaching:
             tmp_bookmarks.unlink()
             result = load_bookmarks()
         assert len(result) == 3
+
+
+class TestFindAppById:
+    """Test the id → app index used to resolve bookmarks."""
+
+    @pytest.fixture(autouse=True)
+    def reset_app_index(self):
+        import utils.helpers as h
+        h._app_index = None
+        yield
+        h._app_index = None
+
+    def _service(self, *app_ids):
+        service = MagicMock()
+        service.apps = [MagicMock(id=app_id) for app_id in app_ids]
+        return service
+
+    def test_finds_app(self):
+        from utils.helpers import find_app_by_id
+        service = self._service("firefox.desktop", "code.desktop")
+        with patch("utils.helpers.ApplicationsService.get_default", return_value=service):
+            assert find_app_by_id("code.desktop") is service.apps[1]
+
+    def test_missing_app_returns_none(self):
+        from utils.helpers import find_app_by_id
+        service = self._service("firefox.desktop")
+        with patch("utils.helpers.ApplicationsService.get_default", return_value=service):
+            assert find_app_by_id("missing.desktop") is None
+
+    def test_index_rebuilt_after_invalidation(self):
+        from utils.helpers import _invalidate_app_index, find_app_by_id
+        service = self._service("firefox.desktop")
+        with patch("utils.helpers.ApplicationsService.get_default", return_value=service):
+            find_app_by_id("firefox.desktop")
+            service.apps = [MagicMock(id="new.desktop")]
+            assert find_app_by_id("new.desktop") is None  # Still cached
+            _invalidate_app_index()
+            assert find_app_by_id("new.desktop") is service.apps[0]
@@ -185,3 +185,40 @@ class TestGetTopApps:
 
         results = svc.get_top_apps(min_launches=2)
         assert len(results) == 0
+
+
+class TestGetTopAppsResolved:
+    """Test top apps mapped through a resolver."""
+
+    def _insert(self, db_path, *rows):
+        conn = sqlite3.connect(str(db_path))
+        conn.executemany("INSERT INTO app_stats VALUES (?, ?, ?, ?)", rows)
+        conn.commit()
+        conn.close()
+
+    def test_resolves_in_frecency_order(self, tmp_db):
+        svc = _make_service(tmp_db)
+        now = int(time.time())
+        self._insert(
+            tmp_db,
+            ("old.desktop", 10, now - 100 * 86400, now - 100 * 86400),
+            ("new.desktop", 2, now - 3600, now - 3600),
+        )
+
+        results = svc.get_top_apps_resolved(10, 1, lambda app_id: app_id.upper())
+        assert [app for app, _score, _count in results] == ["NEW.DESKTOP", "OLD.DESKTOP"]
+        assert results[0][2] == 2
+
+    def test_unresolved_ids_do_not_count_toward_limit(self, tmp_db):
+        svc = _make_service(tmp_db)
+        now = int(time.time())
+        self._insert(
+            tmp_db,
+            ("gone.desktop", 9, now, now),
+            ("a.desktop", 5, now, now),
+            ("b.desktop", 3, now, now),
+        )
+
+        resolver = {"a.desktop": "A", "b.desktop": "B"}.get
+        results = svc.get_top_apps_resolved(2, 1, resolver)
+        assert [app for app, _score, _count in results] == ["A", "B"]
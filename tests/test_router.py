@@ -92,3 +92,40 @@ class TestQueryRouter:
         router.register(StubHandler("b", 200))
         priorities = [h.priority for h in router._handlers]
         assert priorities == [100, 200, 300]
+
+
+class TestTriggerChars:
+    """Test first-character dispatch for handlers declaring trigger_chars."""
+
+    def test_triggered_handler_skipped_for_other_first_char(self):
+        from search.router import QueryRouter
+        calls = []
+        calc = StubHandler("calc", 100, lambda q: calls.append(q) or True)
+        calc.trigger_chars = frozenset("=")
+        router = QueryRouter()
+        router.register(calc)
+        router.register(StubHandler("app_search", 1000))
+        handler_name, _ = router.route("firefox")
+        assert handler_name == "app_search"
+        assert calls == []
+
+    def test_triggered_handler_used_for_its_char(self):
+        from search.router import QueryRouter
+        calc = StubHandler("calc", 100, lambda q: q.strip().startswith("="))
+        calc.trigger_chars = frozenset("=")
+        router = QueryRouter()
+        router.register(StubHandler("app_search", 1000))
+        router.register(calc)
+        handler_name, _ = router.route("  = 2 + 2")
+        assert handler_name == "calc"
+
+    def test_untriggered_handlers_keep_priority_order(self):
+        from search.router import QueryRouter
+        web = StubHandler("web", 200, lambda q: False)
+        web.trigger_chars = frozenset("?")
+        router = QueryRouter()
+        router.register(StubHandler("controls", 50, lambda q: q == "?vol"))
+        router.register(web)
+        router.register(StubHandler("app_search", 1000))
+        assert router.route("?vol")[0] == "controls"
+        assert router.route("?x")[0] == "app_search"